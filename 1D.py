@@ -1,44 +1,53 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
+import heapq
+
+from structures import ListeTriee, MaxSegmentTree
 
 def first_fit(objects, bin_capacity):
+    objects = list(objects)
     bins = []
     placements = []
 
+    # Un bac pas encore ouvert a toute sa capacité libre : la première
+    # feuille assez grande est donc soit un bac ouvert, soit le prochain bac.
+    residus = MaxSegmentTree([bin_capacity] * len(objects))
+
     for i, obj in enumerate(objects):
-        placed = False
-        for j in range(len(bins)):
-            if sum(item[1] for item in bins[j]) + obj <= bin_capacity:
-                bins[j].append((i + 1, obj))
-                placements.append((i + 1, obj, j + 1))
-                placed = True
-                break
-        if not placed:
+        j = residus.first_at_least(obj)
+        if j != -1 and j < len(bins):
+            bins[j].append((i + 1, obj))
+            placements.append((i + 1, obj, j + 1))
+        else:
+            j = len(bins)
             bins.append([(i + 1, obj)])
             placements.append((i + 1, obj, len(bins)))
+        residus.update(j, residus[j] - obj)
 
     return bins, placements
 
 def best_fit(objects, bin_capacity):
+    objects = list(objects)
     bins = []
     placements = []
 
-    for i, obj in enumerate(objects):
-        best_index = -1
-        min_space_left = bin_capacity + 1
-
-        for j, bin in enumerate(bins):
-            space_left = bin_capacity - sum(item[1] for item in bin)
-            if obj <= space_left and space_left < min_space_left:
-                best_index = j
-                min_space_left = space_left
+    # Bacs triés par (espace libre, indice) : le premier couple >= (obj, 0)
+    # est le bac le plus serré, le plus petit indice en cas d'égalité. Un bac
+    # dont l'espace libre est sous le plus petit objet ne resservira pas et
+    # sort de l'index.
+    plus_petit = min(objects, default=0)
+    residus = ListeTriee()
 
-        if best_index != -1:
+    for i, obj in enumerate(objects):
+        trouve = residus.extraire_au_moins((obj, 0))
+        if trouve is not None:
+            space_left, best_index = trouve
             bins[best_index].append((i + 1, obj))
             placements.append((i + 1, obj, best_index + 1))
         else:
+            space_left, best_index = bin_capacity, len(bins)
             bins.append([(i + 1, obj)])
             placements.append((i + 1, obj, len(bins)))
+        if space_left - obj >= plus_petit:
+            residus.ajouter((space_left - obj, best_index))
 
     return bins, placements
 
@@ -46,67 +55,254 @@ def worst_fit(objects, bin_capacity):
     bins = []
     placements = []
 
-    for i, obj in enumerate(objects):
-        worst_index = -1
-        max_space_left = -1
-
-        for j, bin in enumerate(bins):
-            space_left = bin_capacity - sum(item[1] for item in bin)
-            if obj <= space_left and space_left > max_space_left:
-                worst_index = j
-                max_space_left = space_left
+    # Tas max sur l'espace libre (stocké en négatif), puis indice croissant
+    residus = []
 
-        if worst_index != -1:
+    for i, obj in enumerate(objects):
+        if residus and -residus[0][0] >= obj:
+            space_left, worst_index = heapq.heappop(residus)
+            space_left = -space_left
             bins[worst_index].append((i + 1, obj))
             placements.append((i + 1, obj, worst_index + 1))
         else:
+            space_left, worst_index = bin_capacity, len(bins)
             bins.append([(i + 1, obj)])
             placements.append((i + 1, obj, len(bins)))
+        heapq.heappush(residus, (obj - space_left, worst_index))
+
+    return bins, placements
+
+def _grouper_par_taille(objects):
+    """Tri par dénombrement : [(taille, [indices des objets]), ...] par taille décroissante"""
+    groupes = {}
+    for i, obj in enumerate(objects):
+        groupes.setdefault(obj, []).append(i + 1)
+    return sorted(groupes.items(), reverse=True)
+
+def _ranger_serie(bins, placements, j, taille, indices):
+    bins[j] += [(idx, taille) for idx in indices]
+    placements += [(idx, taille, j + 1) for idx in indices]
+
+def _ouvrir_bacs(bins, placements, taille, indices, bin_capacity):
+    """Range des objets identiques qui ne rentrent dans aucun bac ouvert.
+
+    Chaque nouveau bac en reçoit autant que possible (un seul s'il dépasse
+    la capacité) ; renvoie [(espace libre, indice), ...] des nouveaux bacs.
+    """
+    par_bac = max(1, int(bin_capacity // taille))
+    nouveaux = []
+    for debut in range(0, len(indices), par_bac):
+        serie = indices[debut:debut + par_bac]
+        bins.append([])
+        _ranger_serie(bins, placements, len(bins) - 1, taille, serie)
+        nouveaux.append((bin_capacity - len(serie) * taille, len(bins) - 1))
+    return nouveaux
+
+def first_fit_decreasing(objects, bin_capacity):
+    bins = []
+    placements = []
+    residus = MaxSegmentTree([])  # une feuille par bac ouvert
+
+    for taille, indices in _grouper_par_taille(objects):
+        p = 0
+        while p < len(indices):
+            j = residus.first_at_least(taille)
+            if j == -1:
+                break
+            # tous les objets identiques qui rentrent encore vont dans ce bac
+            nb = min(len(indices) - p, int(residus[j] // taille))
+            _ranger_serie(bins, placements, j, taille, indices[p:p + nb])
+            residus.update(j, residus[j] - nb * taille)
+            p += nb
+        for reste, _ in _ouvrir_bacs(bins, placements, taille, indices[p:], bin_capacity):
+            residus.append(reste)
+
+    return bins, placements
+
+def best_fit_decreasing(objects, bin_capacity):
+    objects = list(objects)
+    bins = []
+    placements = []
+    # (espace libre, indice) des bacs qui peuvent encore recevoir le plus
+    # petit objet ; les autres sortent de l'index
+    plus_petit = min(objects, default=0)
+    residus = ListeTriee()
+
+    for taille, indices in _grouper_par_taille(objects):
+        p = 0
+        while p < len(indices):
+            trouve = residus.extraire_au_moins((taille, 0))
+            if trouve is None:
+                break
+            space_left, j = trouve
+            # Le bac choisi reste le plus serré tant que les objets identiques y rentrent
+            nb = min(len(indices) - p, int(space_left // taille))
+            _ranger_serie(bins, placements, j, taille, indices[p:p + nb])
+            if space_left - nb * taille >= plus_petit:
+                residus.ajouter((space_left - nb * taille, j))
+            p += nb
+        for reste, j in _ouvrir_bacs(bins, placements, taille, indices[p:], bin_capacity):
+            if reste >= plus_petit:
+                residus.ajouter((reste, j))
 
     return bins, placements
 
+def worst_fit_decreasing(objects, bin_capacity):
+    bins = []
+    placements = []
+    residus = []  # tas max (espace libre négatif, indice)
+
+    for taille, indices in _grouper_par_taille(objects):
+        p = 0
+        while p < len(indices):
+            if residus and -residus[0][0] >= taille:
+                space_left, j = heapq.heappop(residus)
+                space_left = -space_left
+            else:
+                space_left, j = bin_capacity, len(bins)
+                bins.append([])
+
+            # Le bac reste le plus large tant que son espace libre ne passe pas
+            # sous celui du suivant dans le tas (égalité : plus petit indice)
+            nb = max(1, int(space_left // taille))
+            if residus and -residus[0][0] >= taille:
+                suivant, j2 = -residus[0][0], residus[0][1]
+                ecart = space_left - suivant
+                nb = int(ecart // taille) + 1
+                if j > j2 and ecart % taille == 0:
+                    nb -= 1
+            nb = min(len(indices) - p, max(1, nb))
+
+            _ranger_serie(bins, placements, j, taille, indices[p:p + nb])
+            heapq.heappush(residus, (nb * taille - space_left, j))
+            p += nb
+
+    return bins, placements
+
+def online_fit(objects, bin_capacity, k=2, policy="NKF"):
+    """Rangement en ligne d'un flux d'objets avec au plus k bacs ouverts.
+
+    Chaque bac est produit dès qu'il est fermé, sous la forme
+    (numéro du bac, [(indice objet, taille), ...]) ; les bacs sont numérotés
+    dans l'ordre d'ouverture. Politiques : "NKF" (Next-K-Fit, First Fit
+    parmi les k derniers bacs ouverts) et "HARMONIC" (Harmonic-k, un bac
+    ouvert par classe de taille).
+    """
+    if k < 1:
+        raise ValueError("Il faut au moins un bac ouvert")
+    if policy not in ("NKF", "HARMONIC"):
+        raise ValueError(f"Politique inconnue : {policy}")
+
+    ouverts = {}  # clé -> [numéro, contenu, charge]
+    nb_bacs = 0
+
+    for i, obj in enumerate(objects):
+        if policy == "NKF":
+            cle = next((c for c, bac in ouverts.items() if bac[2] + obj <= bin_capacity), None)
+            if cle is None:
+                if len(ouverts) == k:
+                    # on ferme le plus ancien bac (les dict gardent l'ordre d'insertion)
+                    plus_ancien = next(iter(ouverts))
+                    numero, contenu, _ = ouverts.pop(plus_ancien)
+                    yield numero, contenu
+                nb_bacs += 1
+                cle = nb_bacs
+                ouverts[cle] = [nb_bacs, [], 0]
+        else:
+            # classe j < k : objets de taille dans ]C/(j+1), C/j], j par bac ;
+            # classe k : petits objets rangés en Next Fit
+            cle = next((j for j in range(1, k) if obj * (j + 1) > bin_capacity), k)
+            bac = ouverts.get(cle)
+            if bac is not None and bac[2] + obj > bin_capacity:
+                numero, contenu, _ = ouverts.pop(cle)
+                yield numero, contenu
+                bac = None
+            if bac is None:
+                nb_bacs += 1
+                ouverts[cle] = [nb_bacs, [], 0]
+
+        bac = ouverts[cle]
+        bac[1].append((i + 1, obj))
+        bac[2] += obj
+        if bac[2] >= bin_capacity or (policy == "HARMONIC" and cle < k and len(bac[1]) == cle):
+            numero, contenu, _ = ouverts.pop(cle)
+            yield numero, contenu
+
+    for numero, contenu, _ in ouverts.values():
+        yield numero, contenu
+
 class PackingApp:
     def __init__(self, root):
+        # tkinter n'est chargé qu'ici : les solveurs restent utilisables sans
+        import tkinter
+        from tkinter import messagebox
+        self.tk, self.messagebox = tkinter, messagebox
+
         self.root = root
         self.root.title("1D Bin Packing")
 
         self.objects = []
-        self.bin_capacity = tk.IntVar(value=10)
+        self.bin_capacity = self.tk.IntVar(value=10)
+
+        # Vue virtualisée : seuls les bacs visibles sont dessinés, avec des
+        # éléments du canvas recyclés d'un dessin à l'autre
+        self.bins_affiches = []
+        self.capacite_affichee = 1
+        self.hauteur_bac = 30
+        self._pool = {"rectangle": [], "text": []}
+        self._utilises = {"rectangle": 0, "text": 0}
 
         self.setup_ui()
 
     def setup_ui(self):
         # Paramètres
-        frame_top = tk.Frame(self.root)
+        frame_top = self.tk.Frame(self.root)
         frame_top.pack(pady=10)
 
-        tk.Label(frame_top, text="Capacité d’un bac :").grid(row=0, column=0)
-        tk.Entry(frame_top, textvariable=self.bin_capacity, width=5).grid(row=0, column=1)
+        self.tk.Label(frame_top, text="Capacité d’un bac :").grid(row=0, column=0)
+        self.tk.Entry(frame_top, textvariable=self.bin_capacity, width=5).grid(row=0, column=1)
 
-        tk.Label(frame_top, text="Taille d’un objet :").grid(row=0, column=2)
-        self.obj_entry = tk.Entry(frame_top, width=5)
+        self.tk.Label(frame_top, text="Taille d’un objet :").grid(row=0, column=2)
+        self.obj_entry = self.tk.Entry(frame_top, width=5)
         self.obj_entry.grid(row=0, column=3)
 
-        tk.Button(frame_top, text="Ajouter Objet", command=self.ajouter_objet).grid(row=0, column=4, padx=10)
+        self.tk.Button(frame_top, text="Ajouter Objet", command=self.ajouter_objet).grid(row=0, column=4, padx=10)
 
-        self.objets_label = tk.Label(self.root, text="Objets : []")
+        self.objets_label = self.tk.Label(self.root, text="Objets : []")
         self.objets_label.pack()
 
         # Boutons méthode
-        frame_buttons = tk.Frame(self.root)
+        frame_buttons = self.tk.Frame(self.root)
         frame_buttons.pack(pady=10)
 
-        tk.Button(frame_buttons, text="First Fit", command=lambda: self.appliquer("FF")).pack(side="left", padx=5)
-        tk.Button(frame_buttons, text="Best Fit", command=lambda: self.appliquer("BF")).pack(side="left", padx=5)
-        tk.Button(frame_buttons, text="Worst Fit", command=lambda: self.appliquer("WF")).pack(side="left", padx=5)
+        self.tk.Button(frame_buttons, text="First Fit", command=lambda: self.appliquer("FF")).pack(side="left", padx=5)
+        self.tk.Button(frame_buttons, text="Best Fit", command=lambda: self.appliquer("BF")).pack(side="left", padx=5)
+        self.tk.Button(frame_buttons, text="Worst Fit", command=lambda: self.appliquer("WF")).pack(side="left", padx=5)
+        self.tk.Button(frame_buttons, text="FFD", command=lambda: self.appliquer("FFD")).pack(side="left", padx=5)
+        self.tk.Button(frame_buttons, text="BFD", command=lambda: self.appliquer("BFD")).pack(side="left", padx=5)
+        self.tk.Button(frame_buttons, text="WFD", command=lambda: self.appliquer("WFD")).pack(side="left", padx=5)
 
         # Résultats
-        self.resultats = tk.Text(self.root, width=70, height=15, state="disabled")
+        self.resultats = self.tk.Text(self.root, width=70, height=15, state="disabled")
         self.resultats.pack(pady=10)
         
-        # canva 
-        self.canvas = tk.Canvas(self.root, width=500, height=250, bg="white")
-        self.canvas.pack(pady=10)
+        # canva défilant avec zoom
+        frame_canvas = self.tk.Frame(self.root)
+        frame_canvas.pack(pady=10)
+        self.canvas = self.tk.Canvas(frame_canvas, width=500, height=250, bg="white")
+        defilement = self.tk.Scrollbar(frame_canvas, orient="vertical", command=self.defiler)
+        self.canvas.config(yscrollcommand=defilement.set)
+        self.canvas.pack(side="left")
+        defilement.pack(side="right", fill="y")
+        self.canvas.bind("<Configure>", lambda _: self.redessiner())
+        self.canvas.bind("<MouseWheel>", lambda e: self.defiler("scroll", -e.delta // 120, "units"))
+        self.canvas.bind("<Button-4>", lambda _: self.defiler("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda _: self.defiler("scroll", 1, "units"))
+
+        self.zoom = self.tk.Scale(self.root, from_=4, to=60, orient="horizontal", label="Hauteur d’un bac",
+                                  command=lambda v: self.zoomer(int(v)))
+        self.zoom.set(self.hauteur_bac)
+        self.zoom.pack()
 
 
     def ajouter_objet(self):
@@ -115,10 +311,10 @@ class PackingApp:
             if taille <= 0:
                 raise ValueError
             self.objects.append(taille)
-            self.obj_entry.delete(0, tk.END)
+            self.obj_entry.delete(0, self.tk.END)
             self.update_affichage_objets()
         except ValueError:
-            messagebox.showerror("Erreur", "Veuillez entrer un entier positif.")
+            self.messagebox.showerror("Erreur", "Veuillez entrer un entier positif.")
 
     def update_affichage_objets(self):
         texte = "Objets : [" + ", ".join(map(str, self.objects)) + "]"
@@ -126,7 +322,7 @@ class PackingApp:
 
     def appliquer(self, methode):
         if not self.objects:
-            messagebox.showwarning("Attention", "Aucun objet à placer.")
+            self.messagebox.showwarning("Attention", "Aucun objet à placer.")
             return
 
         capacity = self.bin_capacity.get()
@@ -134,45 +330,115 @@ class PackingApp:
             bins, placements = first_fit(self.objects, capacity)
         elif methode == "BF":
             bins, placements = best_fit(self.objects, capacity)
-        else:
+        elif methode == "WF":
             bins, placements = worst_fit(self.objects, capacity)
+        elif methode == "FFD":
+            bins, placements = first_fit_decreasing(self.objects, capacity)
+        elif methode == "BFD":
+            bins, placements = best_fit_decreasing(self.objects, capacity)
+        else:
+            bins, placements = worst_fit_decreasing(self.objects, capacity)
 
         self.afficher_resultats(bins, placements, capacity)
 
+    # En dessous de cette hauteur (en pixels), un bac est dessiné d'un seul bloc
+    SEUIL_FUSION = 18
+    COULEURS = ["#FF9999", "#99CCFF", "#99FF99", "#FFFF99", "#FFCC99", "#CCCCFF", "#FF66CC"]
+
     def afficher_representations_1D(self, bins, capacity):
-        self.canvas.delete("all")
-        width_unit = 400 / capacity  # pixels par unité de taille
-        height = 30
-        padding = 10
-
-        colors = ["#FF9999", "#99CCFF", "#99FF99", "#FFFF99", "#FFCC99", "#CCCCFF", "#FF66CC"]
-
-        for i, bin in enumerate(bins):
-            y_top = 20
-            y_top += i * (height + padding)
-            x = 10
-            for j, (idx, taille) in enumerate(bin):
-                w = taille * width_unit
-                color = colors[j % len(colors)]
-                self.canvas.create_rectangle(x, y_top, x + w, y_top + height, fill=color, outline="black")
-                self.canvas.create_text(x + w/2, y_top + height/2, text=f"O{idx}(T:{taille})", font=("Arial", 8))
-                x += w
+        self.bins_affiches = bins
+        self.capacite_affichee = capacity
+        self._mettre_a_jour_region()
+        self.canvas.yview_moveto(0)
+        self.redessiner()
+
+    def _pas(self):
+        return self.hauteur_bac + max(1, self.hauteur_bac // 3)
+
+    def _mettre_a_jour_region(self):
+        hauteur = 20 + len(self.bins_affiches) * self._pas()
+        self.canvas.config(scrollregion=(0, 0, 500, hauteur), yscrollincrement=self._pas())
+
+    def defiler(self, *args):
+        self.canvas.yview(*args)
+        self.redessiner()
+
+    def zoomer(self, hauteur):
+        if hauteur == self.hauteur_bac:
+            return
+        # garder le même bac en haut de la vue
+        premier = max(0, (self.canvas.canvasy(0) - 20) / self._pas())
+        self.hauteur_bac = hauteur
+        self._mettre_a_jour_region()
+        total = 20 + len(self.bins_affiches) * self._pas()
+        self.canvas.yview_moveto((20 + premier * self._pas()) / total if premier else 0)
+        self.redessiner()
+
+    def _element(self, genre, coords, **options):
+        # Réutilise un élément caché du pool, ou en crée un nouveau
+        pool = self._pool[genre]
+        n = self._utilises[genre]
+        if n < len(pool):
+            self.canvas.coords(pool[n], *coords)
+            self.canvas.itemconfigure(pool[n], state="normal", **options)
+        elif genre == "rectangle":
+            pool.append(self.canvas.create_rectangle(*coords, **options))
+        else:
+            pool.append(self.canvas.create_text(*coords, **options))
+        self._utilises[genre] = n + 1
+
+    def redessiner(self):
+        pas = self._pas()
+        height = self.hauteur_bac
+        width_unit = 400 / self.capacite_affichee  # pixels par unité de taille
+        fusion = height < self.SEUIL_FUSION
+        utilises_avant = dict(self._utilises)
+        self._utilises = {"rectangle": 0, "text": 0}
+
+        haut = self.canvas.canvasy(0)
+        bas = haut + max(self.canvas.winfo_height(), int(self.canvas.cget("height")))
+        premier = max(0, int((haut - 20) // pas))
+        dernier = min(len(self.bins_affiches), int((bas - 20) // pas) + 1)
+
+        for i in range(premier, dernier):
+            bin = self.bins_affiches[i]
+            y_top = 20 + i * pas
+            if fusion:
+                charge = sum(taille for _, taille in bin)
+                self._element("rectangle", (10, y_top, 10 + charge * width_unit, y_top + height),
+                              fill=self.COULEURS[1], outline="")
+            else:
+                x = 10
+                for j, (idx, taille) in enumerate(bin):
+                    w = taille * width_unit
+                    self._element("rectangle", (x, y_top, x + w, y_top + height),
+                                  fill=self.COULEURS[j % len(self.COULEURS)], outline="black")
+                    self._element("text", (x + w/2, y_top + height/2), text=f"O{idx}(T:{taille})",
+                                  font=("Arial", 8), anchor="center")
+                    x += w
             # Dessin de la bordure totale du bac
-            self.canvas.create_rectangle(10, y_top, 410, y_top + height, outline="black")
-            self.canvas.create_text(415, y_top + height/2, text=f"Bac {i+1}", anchor="w", font=("Arial", 9, "bold"))
+            self._element("rectangle", (10, y_top, 410, y_top + height), fill="", outline="black")
+            if height >= 8:
+                self._element("text", (415, y_top + height/2), text=f"Bac {i+1}", anchor="w",
+                              font=("Arial", 9 if height >= 12 else 7, "bold"))
+
+        # Cacher les éléments du pool qui ne servent plus
+        for genre, pool in self._pool.items():
+            for item in pool[self._utilises[genre]:utilises_avant[genre]]:
+                self.canvas.itemconfigure(item, state="hidden")
 
     def afficher_resultats(self, bins, placements, capacity):
         self.resultats.config(state="normal")
-        self.resultats.delete(1.0, tk.END)
+        self.resultats.delete(1.0, self.tk.END)
 
-        self.resultats.insert(tk.END, f"Capacité d’un bac : {capacity}\n")
-        self.resultats.insert(tk.END, f"Nombre total de bacs utilisés : {len(bins)}\n\n")
+        self.resultats.insert(self.tk.END, f"Capacité d’un bac : {capacity}\n")
+        self.resultats.insert(self.tk.END, f"Nombre total de bacs utilisés : {len(bins)}\n\n")
 
         for i, contenu in enumerate(bins, 1):
             total = sum(t for (_, t) in contenu)
             ligne = f"Bac {i} (rempli = {total}) : "
             ligne += ", ".join([f"Objet {idx} (taille = {taille})" for (idx, taille) in contenu])
-            self.resultats.insert(tk.END, ligne + "\n")
+            self.resultats.insert(self.tk.END, ligne + "\n")
 
         self.afficher_representations_1D(bins, capacity)
         self.resultats.config(state="disabled")
@@ -180,6 +446,8 @@ class PackingApp:
 
 # Lancement de l’application
 if __name__ == "__main__":
+    import tkinter as tk
+
     root = tk.Tk()
     app = PackingApp(root)
     root.mainloop()
@@ -0,0 +1,97 @@
+import numpy as np
+
+def to_ragged(instances):
+    """Liste d'instances (listes de tailles) -> (tailles à plat, offsets)"""
+    longueurs = [len(objets) for objets in instances]
+    offsets = np.zeros(len(instances) + 1, dtype=np.int64)
+    np.cumsum(longueurs, out=offsets[1:])
+    tailles = np.concatenate([np.asarray(objets) for objets in instances if len(objets)]
+                             or [np.zeros(0, dtype=np.int64)])
+    return tailles, offsets
+
+def batch_fit(tailles, offsets, capacites, methode="FF"):
+    """First / Best / Worst Fit sur un lot d'instances indépendantes.
+
+    L'instance k est tailles[offsets[k]:offsets[k + 1]] avec la capacité
+    capacites[k]. Chaque étape place le t-ième objet de toutes les instances
+    encore actives en une seule opération vectorisée. Le tableau des résidus
+    n'a que les colonnes des bacs ouverts (plus une), et n'est élargi que
+    pour les instances encore actives : une longue instance ne fait pas
+    grossir tout le lot.
+
+    Renvoie (affectations, offsets) : affectations[i] est le numéro de bac
+    (à partir de 1) de l'objet i, comme dans les placements de 1D.py.
+    """
+    tailles = np.asarray(tailles)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    capacites = np.broadcast_to(np.asarray(capacites), (len(offsets) - 1,))
+    if methode not in ("FF", "BF", "WF"):
+        raise ValueError(f"Méthode inconnue : {methode}")
+
+    affectations = np.zeros(tailles.shape[0], dtype=np.int64)
+    longueurs = np.diff(offsets)
+    if tailles.shape[0] == 0:
+        return affectations, offsets
+
+    # Instances triées par longueur décroissante : les actives forment un préfixe
+    ordre = np.argsort(-longueurs, kind="stable")
+    longueurs_triees = longueurs[ordre]
+    debuts = offsets[:-1][ordre]
+    n_max = int(longueurs_triees[0])
+
+    type_residu = np.result_type(tailles, capacites)
+    capacites_triees = capacites[ordre].astype(type_residu)
+    residus = np.repeat(capacites_triees[:, None], min(n_max, 16), axis=1)
+    nb_bacs = np.zeros(len(ordre), dtype=np.int64)
+
+    for t in range(n_max):
+        actives = int(np.searchsorted(-longueurs_triees, -t, side="left"))
+        nb = nb_bacs[:actives]
+        # bacs ouverts, plus le prochain à ouvrir (encore à pleine capacité)
+        colonnes = int(nb.max()) + 1
+        if colonnes > residus.shape[1]:
+            # les instances terminées n'ont plus besoin de leurs résidus
+            largeur = min(n_max, 2 * residus.shape[1])
+            agrandi = np.repeat(capacites_triees[:actives, None], largeur, axis=1)
+            agrandi[:, :residus.shape[1]] = residus[:actives]
+            residus = agrandi
+        r = residus[:actives, :colonnes]
+        lignes = np.arange(actives)
+        positions = debuts[:actives] + t
+        obj = tailles[positions]
+
+        rentre = r >= obj[:, None]
+        if methode == "FF":
+            # un bac non ouvert a toute sa capacité : le premier qui rentre
+            # est soit un bac ouvert, soit le prochain à ouvrir
+            j = rentre.argmax(axis=1)
+        else:
+            rentre &= np.arange(colonnes) < nb[:, None]
+            if methode == "BF":
+                j = np.where(rentre, r, np.inf).argmin(axis=1)
+            else:
+                j = np.where(rentre, r, -np.inf).argmax(axis=1)
+        j = np.where(rentre[lignes, j], j, nb)
+
+        r[lignes, j] -= obj
+        np.maximum(nb, j + 1, out=nb)
+        affectations[positions] = j + 1
+
+    return affectations, offsets
+
+def bins_per_instance(affectations, offsets):
+    """Nombre de bacs utilisés par chaque instance"""
+    resultat = np.zeros(len(offsets) - 1, dtype=np.int64)
+    non_vides = np.diff(offsets) > 0
+    if non_vides.any():
+        resultat[non_vides] = np.maximum.reduceat(affectations, offsets[:-1][non_vides])
+    return resultat
+
+# Exemple d'utilisation
+if __name__ == "__main__":
+    instances = [[5, 2, 6, 2, 5], [6, 5, 5, 2, 2], [9, 1, 8, 2]]
+    tailles, offsets = to_ragged(instances)
+    for methode in ("FF", "BF", "WF"):
+        affectations, _ = batch_fit(tailles, offsets, 10, methode)
+        print(methode, bins_per_instance(affectations, offsets),
+              [affectations[offsets[k]:offsets[k + 1]].tolist() for k in range(len(instances))])
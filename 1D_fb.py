@@ -1,31 +1,518 @@
-import copy
+import itertools
+import math
+import multiprocessing
+import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-def bin_packing_all_combinations(objets, capacite):
-    meilleur_resultat = {"bacs": None, "nb": len(objets)}
+def borne_l2(objets, capacite, comptes=None):
+    """Borne L2 de Martello et Toth (toujours au moins égale au volume total divisé par la capacité).
 
-    def placer(index, bacs):
-        if index == len(objets):
-            if len(bacs) < meilleur_resultat["nb"]:
-                meilleur_resultat["nb"] = len(bacs)
-                meilleur_resultat["bacs"] = bacs
+    Avec `comptes`, `objets` liste des tailles distinctes et comptes[i] le
+    nombre d'objets de taille objets[i].
+    """
+    if comptes is None:
+        comptes = [1] * len(objets)
+    paires = sorted(zip(objets, comptes))
+    tries = [t for t, _ in paires]
+    effectifs = list(itertools.accumulate((c for _, c in paires), initial=0))
+    cumul = list(itertools.accumulate((t * c for t, c in paires), initial=0))
+    meilleure = math.ceil(cumul[-1] / capacite) if tries else 0
+    moitie = bisect_right(tries, capacite / 2)
+
+    for k in sorted({0} | {o for o in tries if o <= capacite / 2}):
+        # J1 : o > C - k ; J2 : C/2 < o <= C - k ; J3 : k <= o <= C/2
+        fin_j2 = bisect_right(tries, capacite - k)
+        nb_j1 = effectifs[-1] - effectifs[fin_j2]
+        nb_j2 = effectifs[fin_j2] - effectifs[moitie]
+        vol_j2 = cumul[fin_j2] - cumul[moitie]
+        vol_j3 = cumul[moitie] - cumul[bisect_left(tries, k)]
+        libre_j2 = nb_j2 * capacite - vol_j2
+        borne = nb_j1 + nb_j2 + max(0, math.ceil((vol_j3 - libre_j2) / capacite))
+        meilleure = max(meilleure, borne)
+    return meilleure
+
+def _first_fit_decreasing(tailles, capacite):
+    bacs, residus = [], []
+    for obj in tailles:
+        for i, r in enumerate(residus):
+            if obj <= r:
+                bacs[i].append(obj)
+                residus[i] -= obj
+                break
+        else:
+            bacs.append([obj])
+            residus.append(capacite - obj)
+    return bacs
+
+def _domine(tailles, comptes, choix, libre):
+    """Dominance de Korf : un sous-ensemble du remplissage peut-il être
+    remplacé par un seul objet restant, au moins aussi grand, qui rentre ?"""
+    disponibles = [t for t, c in zip(tailles, comptes) if c]
+    objets = [tailles[j] for j, k in choix for _ in range(k)]
+    for r in range(1, min(len(objets), 6) + 1):
+        for sous_ensemble in set(itertools.combinations(objets, r)):
+            s = sum(sous_ensemble)
+            for x in disponibles:
+                if s <= x <= s + libre and (r > 1 or x > s):
+                    return True
+    return False
+
+def _completions(tailles, comptes, place, debut, marge):
+    """Remplissages maximaux de `place` avec les objets restants (multiensemble).
+
+    Renvoie des couples (somme, [(indice de taille, quantité), ...]). Un
+    remplissage est maximal quand aucun objet restant ne rentre plus ; son
+    gaspillage doit aussi tenir dans la marge laissée par le meilleur résultat.
+    """
+    resultats = []
+    choix = []
+    negatives = [-t for t in tailles]  # croissant, pour bisect
+    # suffixe[j] : volume des objets restants de taille tailles[j:]
+    suffixe = [0] * (len(tailles) + 1)
+    for j in range(len(tailles) - 1, -1, -1):
+        suffixe[j] = suffixe[j + 1] + tailles[j] * comptes[j]
+
+    def completer(j, libre):
+        if libre - suffixe[j] > marge:
+            return  # même en prenant tout le reste, on gaspille trop
+        maximal = True
+        # Les objets sont pris par indice croissant : chaque multiensemble une fois
+        for j2 in range(max(j, bisect_left(negatives, -libre)), len(tailles)):
+            if comptes[j2]:
+                maximal = False
+                comptes[j2] -= 1
+                choix.append(j2)
+                completer(j2, libre - tailles[j2])
+                choix.pop()
+                comptes[j2] += 1
+        if not maximal or libre > marge:
             return
+        for t, c in zip(tailles, comptes):
+            if c and t <= libre:
+                return  # un objet restant plus grand rentre encore
+        paires = [(j2, choix.count(j2)) for j2 in sorted(set(choix))]
+        if not _domine(tailles, comptes, paires, libre):
+            resultats.append((place - libre, paires))
+
+    completer(debut, place)
+    resultats.sort(key=lambda r: r[0], reverse=True)
+    return resultats
+
+def _explorer(tailles, comptes, capacite, reste, bacs, gaspillage, meilleur, borne, total,
+              echecs, arret=None):
+    """Séparation et évaluation en place, un bac complet à la fois.
+
+    Le bac suivant reçoit toujours le plus grand objet restant, puis chaque
+    remplissage maximal du reste ; renvoie True quand il faut tout arrêter.
+    `echecs` mémorise, pour chaque multiensemble restant déjà exploré, le
+    nombre de bacs dont on a prouvé qu'il a besoin.
+    """
+    if arret is not None and arret():
+        return True
+
+    if reste == 0:
+        if len(bacs) < meilleur["nb"]:
+            meilleur["nb"] = len(bacs)
+            meilleur["bacs"] = [list(bac) for bac in bacs]
+        return meilleur["nb"] <= borne
+
+    if len(bacs) + math.ceil(reste / capacite) >= meilleur["nb"]:
+        return False
+    etat = tuple(comptes)
+    if len(bacs) + echecs.get(etat, 0) >= meilleur["nb"]:
+        return False
+    if len(bacs) + borne_l2(tailles, capacite, comptes) >= meilleur["nb"]:
+        return False
+
+    # Gaspillage encore permis pour battre le meilleur résultat
+    marge = (meilleur["nb"] - 1) * capacite - total - gaspillage
+
+    i = next(j for j, c in enumerate(comptes) if c)
+    comptes[i] -= 1
+    for somme, choix in _completions(tailles, comptes, capacite - tailles[i], i, marge):
+        bac = [tailles[i]]
+        for j, k in choix:
+            comptes[j] -= k
+            bac.extend([tailles[j]] * k)
+        bacs.append(bac)
+        perte = capacite - tailles[i] - somme
+        fini = _explorer(tailles, comptes, capacite, reste - tailles[i] - somme, bacs,
+                         gaspillage + perte, meilleur, borne, total, echecs, arret)
+        bacs.pop()
+        for j, k in choix:
+            comptes[j] += k
+        if fini:
+            comptes[i] += 1
+            return True
+        # La marge a pu se resserrer si le meilleur résultat s'est amélioré
+        if gaspillage + perte > (meilleur["nb"] - 1) * capacite - total:
+            break
+    comptes[i] += 1
+    echecs[etat] = max(echecs.get(etat, 0), meilleur["nb"] - len(bacs))
+    return False
+
+def _preparer(objets, capacite):
+    # Un objet plus grand que la capacité occupe forcément un bac à lui seul
+    grands = [[obj] for obj in objets if obj > capacite]
+    tailles = sorted((obj for obj in objets if obj <= capacite), reverse=True)
+    distinctes = sorted(set(tailles), reverse=True)
+    comptes = [tailles.count(t) for t in distinctes]
+    bacs = _first_fit_decreasing(tailles, capacite)
+    return grands, distinctes, comptes, borne_l2(tailles, capacite), {"bacs": bacs, "nb": len(bacs)}
+
+def bin_packing_all_combinations(objets, capacite, max_noeuds=None, timeout=None, preuve=False):
+    """Recherche exacte du nombre minimal de bacs.
+
+    Le temps de calcul n'est pas borné en général (il peut dépasser
+    plusieurs minutes sur une centaine d'objets). Avec max_noeuds ou timeout
+    (en secondes), renvoie la meilleure solution trouvée dans le budget, au
+    pire celle de First Fit Decreasing. Pour des tailles entières, la borne
+    de génération de colonnes (borne_lp) arrête alors la recherche dès
+    qu'elle est atteinte, et la seconde moitié du budget passe à la
+    recherche à cible fixe de bin_packing_dp (un rangement en autant de
+    bacs que la borne).
+    Avec preuve=True, renvoie (nombre de bacs, bacs, optimal) : optimal est
+    False quand le budget s'est épuisé avant la preuve d'optimalité.
+    """
+    grands, tailles, comptes, borne, meilleur_resultat = _preparer(objets, capacite)
+    optimal = True
+
+    if meilleur_resultat["nb"] > borne:
+        total = sum(t * c for t, c in zip(tailles, comptes))
+        budget = max_noeuds is not None or timeout is not None
+        entiers = budget and isinstance(capacite, int) and all(isinstance(t, int) for t in tailles)
+        debut = time.monotonic()
+        if entiers:
+            borne = max(borne, borne_lp(tailles, comptes, capacite))
+        etat = {"noeuds": 0, "limite": max_noeuds, "fin": None}
+        if timeout is not None:
+            etat["fin"] = debut + (timeout / 2 if entiers else timeout)
+        if entiers and max_noeuds is not None:
+            etat["limite"] = max_noeuds // 2
+
+        def epuise():
+            etat["noeuds"] += 1
+            if etat["limite"] is not None and etat["noeuds"] > etat["limite"]:
+                return True
+            return (etat["fin"] is not None and etat["noeuds"] % 1024 == 0
+                    and time.monotonic() > etat["fin"])
+
+        echecs = {}
+        arret = meilleur_resultat["nb"] > borne and _explorer(
+            tailles, comptes, capacite, total, [], 0, meilleur_resultat, borne, total, echecs,
+            epuise if budget else None)
+        if arret and entiers and meilleur_resultat["nb"] > borne:
+            # Le reste du budget cherche directement un rangement à la borne
+            # (echecs a le même sens dans les deux recherches)
+            etat["limite"] = max_noeuds
+            etat["fin"] = debut + timeout if timeout is not None else None
+            solution = _chercher(tailles, tuple(comptes), capacite, borne, total, echecs, epuise)
+            if solution is not None:
+                meilleur_resultat["nb"], meilleur_resultat["bacs"] = len(solution), solution
+        optimal = not arret or meilleur_resultat["nb"] <= borne
+
+    bacs = grands + meilleur_resultat["bacs"]
+    if preuve:
+        return len(bacs), bacs, optimal
+    return len(bacs), bacs
+
+# Etat partagé par les processus de bin_packing_parallele
+_partage = {}
+
+def _initialiser_processus(meilleur_nb, echeance):
+    _partage["nb"] = meilleur_nb
+    _partage["echeance"] = echeance
+
+def _explorer_sous_arbre(tailles, comptes, capacite, reste, bacs, gaspillage, borne, total):
+    meilleur_nb = _partage["nb"]
+    echeance = _partage["echeance"]
+    meilleur = {"nb": meilleur_nb.value, "bacs": None}
+
+    def arret():
+        # Publier une amélioration locale, ou récupérer celle d'un autre processus
+        if meilleur["bacs"] is not None and meilleur["nb"] < meilleur_nb.value:
+            with meilleur_nb.get_lock():
+                if meilleur["nb"] < meilleur_nb.value:
+                    meilleur_nb.value = meilleur["nb"]
+        meilleur["nb"] = min(meilleur["nb"], meilleur_nb.value)
+        return meilleur["nb"] <= borne or (echeance is not None and time.time() > echeance)
+
+    _explorer(tailles, comptes, capacite, reste, bacs, gaspillage, meilleur, borne, total, {}, arret)
+    arret()
+    return meilleur["bacs"]
+
+def _sous_arbres(tailles, comptes, capacite, reste, bacs, gaspillage, meilleur, total, profondeur):
+    """Etats (comptes, bacs, reste, gaspillage) des noeuds à `profondeur` bacs"""
+    if reste == 0 or profondeur == 0:
+        yield list(comptes), [list(bac) for bac in bacs], reste, gaspillage
+        return
+    if len(bacs) + math.ceil(reste / capacite) >= meilleur["nb"]:
+        return
+    marge = (meilleur["nb"] - 1) * capacite - total - gaspillage
+    i = next(j for j, c in enumerate(comptes) if c)
+    comptes[i] -= 1
+    for somme, choix in _completions(tailles, comptes, capacite - tailles[i], i, marge):
+        bac = [tailles[i]]
+        for j, k in choix:
+            comptes[j] -= k
+            bac.extend([tailles[j]] * k)
+        bacs.append(bac)
+        yield from _sous_arbres(tailles, comptes, capacite, reste - tailles[i] - somme, bacs,
+                                gaspillage + capacite - tailles[i] - somme, meilleur, total,
+                                profondeur - 1)
+        bacs.pop()
+        for j, k in choix:
+            comptes[j] += k
+    comptes[i] += 1
+
+def bin_packing_parallele(objets, capacite, profondeur=2, processus=None, timeout=None):
+    """Recherche exacte répartie sur un pool de processus.
+
+    L'arbre est coupé après `profondeur` bacs ; chaque sous-arbre est exploré
+    par un processus et le meilleur nombre de bacs est partagé en mémoire
+    pour que tous élaguent avec. Passé `timeout` secondes, on renvoie la
+    meilleure solution trouvée (sans preuve d'optimalité).
+    """
+    grands, tailles, comptes, borne, meilleur_resultat = _preparer(objets, capacite)
+
+    if meilleur_resultat["nb"] > borne:
+        total = sum(t * c for t, c in zip(tailles, comptes))
+        taches = list(_sous_arbres(tailles, comptes, capacite, total, [], 0,
+                                   meilleur_resultat, total, profondeur))
+        echeance = time.time() + timeout if timeout is not None else None
+        meilleur_nb = multiprocessing.Value("i", meilleur_resultat["nb"])
+
+        with ProcessPoolExecutor(processus, initializer=_initialiser_processus,
+                                 initargs=(meilleur_nb, echeance)) as executeur:
+            futures = [
+                executeur.submit(_explorer_sous_arbre, tailles, etat, capacite, reste,
+                                 bacs, gaspillage, borne, total)
+                for etat, bacs, reste, gaspillage in taches
+            ]
+            for future in as_completed(futures):
+                bacs = future.result()
+                if bacs is not None and len(bacs) < meilleur_resultat["nb"]:
+                    meilleur_resultat["nb"] = len(bacs)
+                    meilleur_resultat["bacs"] = bacs
+                    if len(bacs) <= borne:
+                        for f in futures:
+                            f.cancel()
+                        break
+
+    bacs = grands + meilleur_resultat["bacs"]
+    return len(bacs), bacs
+
+def _sommes_multiensemble(tailles, comptes, capacite):
+    # Sommes de sous-ensembles <= capacite sous forme d'entier (bit s = somme s) ;
+    # chaque quantité est découpée en paquets 1, 2, 4, ...
+    masque = (1 << (capacite + 1)) - 1
+    bits = 1
+    for t, c in zip(tailles, comptes):
+        paquet = 1
+        while c > 0:
+            k = min(paquet, c)
+            bits = (bits | (bits << (k * t))) & masque
+            c -= k
+            paquet *= 2
+    return bits
+
+def _sac_a_dos(tailles, comptes, valeurs, capacite):
+    """Sac à dos borné indexé par la capacité : (valeur max, quantités par taille)"""
+    objets = []  # découpage binaire : (poids, valeur, indice de taille, quantité)
+    for i, (t, c, v) in enumerate(zip(tailles, comptes, valeurs)):
+        if v <= 0:
+            continue
+        q, paquet = min(c, capacite // t), 1
+        while q > 0:
+            k = min(paquet, q)
+            objets.append((k * t, k * v, i, k))
+            q -= k
+            paquet *= 2
+
+    meilleur = [0.0] * (capacite + 1)
+    pris = []
+    for poids, valeur, _, _ in objets:
+        prend = bytearray(capacite + 1)
+        for w in range(capacite, poids - 1, -1):
+            candidat = meilleur[w - poids] + valeur
+            if candidat > meilleur[w] + 1e-12:
+                meilleur[w] = candidat
+                prend[w] = 1
+        pris.append(prend)
+
+    motif = [0] * len(tailles)
+    w = capacite
+    for (poids, _, i, k), prend in zip(reversed(objets), reversed(pris)):
+        if prend[w]:
+            motif[i] += k
+            w -= poids
+    return meilleur[capacite], motif
+
+def borne_lp(tailles, comptes, capacite, epsilon=1e-9, max_iterations=None):
+    """Borne de la relaxation continue du modèle par motifs (Gilmore-Gomory,
+    de même valeur que le modèle arc-flow), par génération de colonnes.
+
+    Le maître min somme(x_p) s.c. somme(a_ip x_p) >= comptes[i] est résolu
+    par un simplexe révisé dense ; après un pivot dégénéré, la règle de Bland
+    (variable de plus petit numéro en entrée comme en sortie) empêche le
+    cyclage. Chaque motif
+    entrant est trouvé par un sac à dos indexé par la capacité sur les
+    variables duales. À chaque sac à dos, les duales y >= 0 donnent la borne
+    de Farley somme(comptes[i] y_i) / (valeur du sac à dos), toujours valide ;
+    on s'arrête dès que son arrondi égale celui de l'objectif du maître
+    (l'optimum continu est entre les deux). La génération de colonnes peut
+    converger lentement quand presque toutes les tailles sont distinctes :
+    passé max_iterations pivots, on renvoie la meilleure borne prouvée,
+    Farley ou L2, sans attendre l'optimum continu.
+    """
+    d = len(tailles)
+    if d == 0:
+        return 0
+    if max_iterations is None:
+        max_iterations = 5 * d + 100
+    # Base initiale réalisable : un motif homogène par taille. Les variables
+    # sont numérotées : écarts 0..d-1, puis motifs dans l'ordre d'apparition.
+    homogenes = [min(c, capacite // t) for t, c in zip(tailles, comptes)]
+    motifs = {}
+    for i, a in enumerate(homogenes):
+        motifs[tuple(a if j == i else 0 for j in range(d))] = d + i
+    base = [d + i for i in range(d)]
+    inverse = [[1 / homogenes[i] if i == j else 0.0 for j in range(d)] for i in range(d)]
+    couts = [1.0] * d
+    x = [c / a for c, a in zip(comptes, homogenes)]
+    farley = 0
+    bland = False
+
+    for _ in range(max_iterations):
+        duales = [sum(couts[i] * inverse[i][j] for i in range(d)) for j in range(d)]
+        entrante = None
+        for i in range(d):
+            if duales[i] < -epsilon:
+                # variable d'écart de la contrainte i (les plus petits numéros)
+                entrante = (i, [-1.0 if j == i else 0.0 for j in range(d)], 0.0)
+                break
+        if entrante is None:
+            positives = [max(0.0, y) for y in duales]
+            valeur, motif = _sac_a_dos(tailles, comptes, positives, capacite)
+            if valeur > epsilon:
+                farley = max(farley, math.ceil(sum(c * y for c, y in zip(comptes, positives)) / valeur - 1e-6))
+            objectif = math.ceil(sum(c * v for c, v in zip(couts, x)) - 1e-6)
+            if valeur <= 1 + epsilon or farley >= objectif:
+                break  # optimum atteint, ou son arrondi déjà connu
+            # Bland : motif déjà connu de plus petit numéro à coût réduit négatif
+            numero = None
+            if bland:
+                numero = min((n for m, n in motifs.items() if n not in base
+                              and sum(a * y for a, y in zip(m, duales)) > 1 + epsilon), default=None)
+            if numero is None:
+                motif = tuple(motif)
+                numero = motifs.setdefault(motif, d + len(motifs))
+            else:
+                motif = next(m for m, n in motifs.items() if n == numero)
+            entrante = (numero, [float(a) for a in motif], 1.0)
+        numero, colonne, cout = entrante
+
+        u = [sum(inverse[i][j] * colonne[j] for j in range(d)) for i in range(d)]
+        ratio = min(x[i] / u[i] for i in range(d) if u[i] > epsilon)
+        r = min((i for i in range(d) if u[i] > epsilon and x[i] / u[i] <= ratio + epsilon),
+                key=lambda i: base[i])
+        theta = x[r] / u[r]
+        bland = theta <= epsilon
+        x = [max(0.0, x[i] - theta * u[i]) for i in range(d)]
+        x[r] = theta
+        ligne = [v / u[r] for v in inverse[r]]
+        for i in range(d):
+            if i != r and u[i]:
+                inverse[i] = [a - u[i] * b for a, b in zip(inverse[i], ligne)]
+        inverse[r] = ligne
+        couts[r] = cout
+        base[r] = numero
+
+    return max(farley, borne_l2(tailles, capacite, comptes))
+
+def _chercher(tailles, depart, capacite, cible, total, echecs, arret=None):
+    """Rangement en au plus `cible` bacs (liste des bacs) ou None.
+
+    Même parcours bac par bac que _explorer, avec une pile explicite car le
+    nombre de bacs peut dépasser la limite de récursion de Python. Renvoie
+    aussi None dès que arret() est vrai.
+    """
+    def ouvrir(etat, k, reste):
+        if k + echecs.get(etat, 0) > cible or k + borne_l2(tailles, capacite, etat) > cible:
+            return None
+        comptes = list(etat)
+        i = next(j for j, c in enumerate(comptes) if c)
+        comptes[i] -= 1
+        place = capacite - tailles[i]
+        # Le bac du plus grand objet contient au plus son meilleur remplissage
+        remplissage = _sommes_multiensemble(tailles, comptes, place).bit_length() - 1
+        if k + 1 + math.ceil((reste - tailles[i] - remplissage) / capacite) > cible:
+            return None
+        enfants = []
+        for somme, choix in _completions(tailles, comptes, place, i, (cible - k) * capacite - reste):
+            enfant = list(comptes)
+            bac = [tailles[i]]
+            for j, q in choix:
+                enfant[j] -= q
+                bac.extend([tailles[j]] * q)
+            enfants.append((tuple(enfant), reste - tailles[i] - somme, bac))
+        return [etat, k, enfants, 0]
+
+    cadre = ouvrir(depart, 0, total)
+    pile = [cadre] if cadre else []
+    while pile:
+        if arret is not None and arret():
+            return None
+        etat, k, enfants, suivant = pile[-1]
+        if suivant == len(enfants):
+            echecs[etat] = max(echecs.get(etat, 0), cible - k + 1)
+            pile.pop()
+            continue
+        pile[-1][3] += 1
+        enfant, reste, _ = enfants[suivant]
+        if reste == 0:
+            return [c[2][c[3] - 1][2] for c in pile]
+        cadre = ouvrir(enfant, k + 1, reste)
+        if cadre:
+            pile.append(cadre)
+    return None
 
-        obj = objets[index]
+def bin_packing_dp(objets, capacite):
+    """Solveur exact pour les petites capacités entières.
 
-        # Essayer d'ajouter l'objet à chaque bac existant
-        for i in range(len(bacs)):
-            if sum(bacs[i]) + obj <= capacite:
-                nouveaux_bacs = copy.deepcopy(bacs)
-                nouveaux_bacs[i].append(obj)
-                placer(index + 1, nouveaux_bacs)
+    La borne inférieure est la relaxation du modèle par motifs (borne_lp),
+    presque toujours égale à l'optimum, et chaque motif entrant ne coûte
+    qu'un sac à dos en O(capacité x tailles distinctes). borne_lp ne renvoie
+    que des bornes prouvées (Farley ou L2) : la première cible ne dépasse
+    jamais l'optimum, et le résultat est donc optimal. On cherche ensuite
+    un rangement en autant de bacs que la borne, puis un de plus, etc. Les
+    bacs sont remplis un à un sur le multiensemble des tailles, chemins du
+    graphe arc-flow 0..capacite à tailles non croissantes. Le meilleur
+    remplissage possible, par somme de sous-ensembles sur bitset, élague
+    chaque noeud.
+    """
+    grands = [[obj] for obj in objets if obj > capacite]
+    quantites = {}
+    for obj in objets:
+        if obj <= capacite:
+            quantites[obj] = quantites.get(obj, 0) + 1
+    tailles = sorted(quantites, reverse=True)
+    depart = tuple(quantites[t] for t in tailles)
+    total = sum(t * c for t, c in zip(tailles, depart))
 
-        # Essayer de créer un nouveau bac
-        nouveaux_bacs = copy.deepcopy(bacs)
-        nouveaux_bacs.append([obj])
-        placer(index + 1, nouveaux_bacs)
+    bacs = _first_fit_decreasing([t for t, c in zip(tailles, depart) for _ in range(c)], capacite)
+    if total:
+        borne = borne_lp(tailles, depart, capacite)
+        echecs = {}
+        for cible in range(borne, len(bacs)):
+            solution = _chercher(tailles, depart, capacite, cible, total, echecs)
+            if solution is not None:
+                bacs = solution
+                break
 
-    placer(0, [])
-    return meilleur_resultat["nb"], meilleur_resultat["bacs"]
+    bacs = grands + bacs
+    return len(bacs), bacs
 
 # Exemple d'utilisation
 if __name__ == "__main__":
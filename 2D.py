@@ -1,9 +1,14 @@
-import tkinter as tk
-import copy
+import heapq
+import math
+import time
+from bisect import bisect_left, bisect_right
 
-def NFDH(rectangles, W, H):
+from placements import PlacementArray
+from structures import ListeTriee, MaxSegmentTree
+
+def NFDH(rectangles, W, H, columnar=False):
     rectangles = sorted(rectangles, key=lambda r: r[1], reverse=True)
-    placements = []
+    placements = PlacementArray() if columnar else []
     current_shelf_y = 0
     current_shelf_height = 0
     current_x = 0
@@ -29,120 +34,496 @@ def NFDH(rectangles, W, H):
 
     return placements
 
-def FFDH(rectangles, W, H):
+def FFDH(rectangles, W, H, columnar=False):
     rectangles = sorted(rectangles, key=lambda r: r[1], reverse=True)
     shelves = []  # Chaque étagère = (y_start, height, used_width)
-    placements = []
+    # Par hauteur décroissante, toutes les étagères ouvertes sont au moins
+    # aussi hautes que le rectangle : seule la largeur libre compte
+    libres = MaxSegmentTree([float("-inf")] * len(rectangles))  # largeur libre par étagère
+    current_y = 0
+    placements = PlacementArray() if columnar else []
 
     for i, (w, h) in enumerate(rectangles):
-        placed = False
-        for shelf in shelves:
-            y_start, shelf_height, used_width = shelf
-            if h <= shelf_height and used_width + w <= W:
-                placements.append({
-                    "id": i + 1,
-                    "position": (used_width, y_start),
-                    "dimension": (w, h)
-                })
-                shelf[2] += w  # mise à jour largeur utilisée
-                placed = True
-                break
-
-        if not placed:
-            current_y = sum(s[1] for s in shelves)
+        j = libres.first_at_least(w)
+        if j >= 0:
+            shelf = shelves[j]
+            placements.append({
+                "id": i + 1,
+                "position": (shelf[2], shelf[0]),
+                "dimension": (w, h)
+            })
+            shelf[2] += w  # mise à jour largeur utilisée
+            libres.update(j, W - shelf[2])
+        else:
             if current_y + h > H:
                 continue  # impossible à placer
+            libres.update(len(shelves), W - w)
             shelves.append([current_y, h, w])
             placements.append({
                 "id": i + 1,
                 "position": (0, current_y),
                 "dimension": (w, h)
             })
+            current_y += h
 
     return placements
 
-def BFDH(rectangles, W, H):
+def FFDH_multi(rectangles, W, H, columnar=False):
+    """FFDH sur plusieurs plaques W x H, ouvertes au fur et à mesure.
+
+    Deux arbres de segments indexent les plaques ouvertes : la plus grande
+    largeur libre de leurs étagères et la hauteur restante. Un rectangle va
+    sur la première étagère qui le reçoit, sinon sur une nouvelle étagère
+    de la première plaque assez haute, sinon sur une nouvelle plaque.
+    Chaque placement indique sa plaque ("bac", à partir de 1) ; les ids sont
+    les indices d'origine + 1. Seuls les rectangles plus grands qu'une
+    plaque ne sont pas placés.
+    """
+    ordre = sorted(range(len(rectangles)), key=lambda i: rectangles[i][1], reverse=True)
+    plaques = []  # étagères de chaque plaque : [y_start, height, used_width]
+    largeur_libre = MaxSegmentTree([float("-inf")] * len(rectangles))
+    hauteur_libre = MaxSegmentTree([float("-inf")] * len(rectangles))
+    placements = PlacementArray() if columnar else []
+
+    for i in ordre:
+        w, h = rectangles[i]
+        if w > W or h > H:
+            continue
+
+        p = largeur_libre.first_at_least(w)
+        if p >= 0:
+            # les étagères ouvertes sont toutes au moins aussi hautes que h
+            shelf = next(s for s in plaques[p] if W - s[2] >= w)
+            x, y = shelf[2], shelf[0]
+            shelf[2] += w
+        else:
+            p = hauteur_libre.first_at_least(h)
+            if p < 0:
+                p = len(plaques)
+                plaques.append([])
+            shelves = plaques[p]
+            y = shelves[-1][0] + shelves[-1][1] if shelves else 0
+            x = 0
+            shelves.append([y, h, w])
+            hauteur_libre.update(p, H - y - h)
+        largeur_libre.update(p, max(W - s[2] for s in plaques[p]))
+
+        placements.append({
+            "id": i + 1,
+            "bac": p + 1,
+            "position": (x, y),
+            "dimension": (w, h)
+        })
+
+    return placements
+
+def BFDH(rectangles, W, H, columnar=False):
     rectangles = sorted(rectangles, key=lambda r: r[1], reverse=True)
     shelves = []  # Chaque étagère = (y_start, height, used_width)
-    placements = []
+    # (espace libre, indice) des étagères qui peuvent encore recevoir un des
+    # rectangles restants : meilleure étagère en premier, les autres sortent
+    # de l'index
+    par_espace = ListeTriee()
+    plus_petit = [math.inf] * (len(rectangles) + 1)  # plus petite largeur de rectangles[i:]
+    for i in range(len(rectangles) - 1, -1, -1):
+        plus_petit[i] = min(plus_petit[i + 1], rectangles[i][0])
+    current_y = 0
+    placements = PlacementArray() if columnar else []
 
     for i, (w, h) in enumerate(rectangles):
-        best_shelf = None
-        min_space_left = float('inf')
-
-        for shelf in shelves:
-            y_start, shelf_height, used_width = shelf
-            space_left = W - used_width
-            if h <= shelf_height and w <= space_left and space_left < min_space_left:
-                best_shelf = shelf
-                min_space_left = space_left
-
-        if best_shelf:
-            y_start, shelf_height, used_width = best_shelf
+        # Par hauteur décroissante, toutes les étagères ouvertes sont au
+        # moins aussi hautes que le rectangle : seule la largeur compte
+        trouve = par_espace.extraire_au_moins((w, -1))
+
+        if trouve is not None:
+            best_shelf = shelves[trouve[1]]
             placements.append({
                 "id": i + 1,
-                "position": (used_width, y_start),
+                "position": (best_shelf[2], best_shelf[0]),
                 "dimension": (w, h)
             })
             best_shelf[2] += w
+            j = trouve[1]
         else:
-            current_y = sum(s[1] for s in shelves)
             if current_y + h > H:
                 continue
+            j = len(shelves)
             shelves.append([current_y, h, w])
             placements.append({
                 "id": i + 1,
                 "position": (0, current_y),
                 "dimension": (w, h)
             })
+            current_y += h
+        if W - shelves[j][2] >= plus_petit[i + 1]:
+            par_espace.ajouter((W - shelves[j][2], j))
+
+    return placements
+
+def Skyline(rectangles, W, H, columnar=False):
+    """Placement bas-gauche sur une ligne d'horizon.
+
+    L'horizon est une suite de segments (x de début, hauteur) triés par x ;
+    chaque rectangle (par hauteur décroissante) va à la position la plus
+    basse, puis la plus à gauche. Les ids sont les indices d'origine + 1.
+    Un tas des segments par hauteur croissante donne les débuts candidats :
+    un rectangle posé au début d'un segment est au moins à sa hauteur, on
+    s'arrête donc au premier segment plus haut que la meilleure position.
+    """
+    ordre = sorted(range(len(rectangles)), key=lambda i: rectangles[i][1], reverse=True)
+    xs = [0, W]  # débuts des segments, avec W en sentinelle
+    ys = [0]     # hauteur de chaque segment
+    hauteur = {0: 0}  # début de segment -> hauteur, pour valider les entrées du tas
+    bas = [(0, 0)]    # tas (hauteur, début), entrées périmées comprises
+    placements = PlacementArray() if columnar else []
+
+    for i in ordre:
+        w, h = rectangles[i]
+        if w > W or h > H:
+            continue
+
+        meilleur = (math.inf, None, None)  # (y, x, indice du segment)
+        vus = []
+        while bas:
+            y0, x0 = bas[0]
+            if hauteur.get(x0) != y0:
+                heapq.heappop(bas)
+                continue
+            if y0 > meilleur[0] or y0 + h > H:
+                break
+            vus.append(heapq.heappop(bas))
+            if x0 + w > W:
+                continue
+            # hauteur de pose : maximum des segments sous [x0, x0 + w), en
+            # abandonnant dès qu'elle dépasse la meilleure position
+            plafond = min(meilleur[0], H - h)
+            a = bisect_left(xs, x0)
+            y, fin = y0, a + 1
+            while xs[fin] < x0 + w:
+                if ys[fin] > y:
+                    y = ys[fin]
+                    if y > plafond:
+                        break
+                fin += 1
+            if y <= plafond and (y < meilleur[0] or x0 < meilleur[1]):
+                meilleur = (y, x0, a)
+        for candidat in vus:
+            heapq.heappush(bas, candidat)
+
+        y, x, a = meilleur
+        if x is None:
+            continue
+        placements.append({
+            "id": i + 1,
+            "position": (x, y),
+            "dimension": (w, h)
+        })
+
+        # Mise à jour de l'horizon : [x, x + w) passe à la hauteur y + h
+        b = bisect_left(xs, x + w, a)
+        for debut in xs[a:b]:
+            del hauteur[debut]
+        if xs[b] == x + w:
+            xs[a:b], ys[a:b] = [x], [y + h]
+        else:
+            reste = ys[b - 1]
+            xs[a:b], ys[a:b] = [x, x + w], [y + h, reste]
+            hauteur[x + w] = reste
+            heapq.heappush(bas, (reste, x + w))
+        hauteur[x] = y + h
+        heapq.heappush(bas, (y + h, x))
+        # fusion avec les voisins de même hauteur
+        if a + 1 < len(ys) and ys[a + 1] == ys[a]:
+            del hauteur[xs[a + 1]]
+            del xs[a + 1], ys[a + 1]
+        if a > 0 and ys[a - 1] == ys[a]:
+            del hauteur[xs[a]]
+            del xs[a], ys[a]
 
     return placements
 
-def brute_force_packing_2d(rectangles, W, H):
-    meilleur = {"placements": None, "shelves": None, "nb_shelves": float("inf")}
-
-    def placer(index, placements, shelves):
-        if index == len(rectangles):
-            if len(shelves) < meilleur["nb_shelves"]:
-                meilleur["nb_shelves"] = len(shelves)
-                meilleur["placements"] = copy.deepcopy(placements)
-                meilleur["shelves"] = copy.deepcopy(shelves)
-            return
-
-        w, h = rectangles[index]
-
-        # Essayer de placer le rectangle sur chaque étagère existante
-        for i in range(len(shelves)):
-            y_start, shelf_height, used_width = shelves[i]
-            if h <= shelf_height and used_width + w <= W:
-                # Créer nouvelle configuration
-                new_placements = copy.deepcopy(placements)
-                new_shelves = copy.deepcopy(shelves)
-                new_shelves[i][2] += w  # ajouter largeur utilisée
-                new_placements.append({
-                    "id": index + 1,
-                    "position": (used_width, y_start),
-                    "dimension": (w, h)
-                })
-                placer(index + 1, new_placements, new_shelves)
+def _score_maxrects(libre, w, h, heuristique):
+    x, y, lw, lh = libre
+    reste_w, reste_h = lw - w, lh - h
+    if heuristique == "BSSF":  # plus petit côté restant
+        return (min(reste_w, reste_h), max(reste_w, reste_h))
+    if heuristique == "BAF":  # plus petite surface restante
+        return (lw * lh - w * h, min(reste_w, reste_h))
+    return (y + h, x)  # BL : bas-gauche
+
+def MaxRects(rectangles, W, H, heuristique="BSSF", columnar=False):
+    """Placement MaxRects : on garde tous les rectangles libres maximaux.
+
+    heuristique : "BSSF" (meilleur petit côté), "BAF" (meilleure surface)
+    ou "BL" (bas-gauche). Les ids sont les indices d'origine + 1.
+    Un rectangle libre qui ne peut plus recevoir aucun des rectangles
+    restants est oublié dès sa création, ou à l'étape où il le devient :
+    la liste parcourue ne garde que l'espace encore utile.
+    """
+    if heuristique not in ("BSSF", "BAF", "BL"):
+        raise ValueError(f"Heuristique inconnue : {heuristique}")
+    ordre = sorted(range(len(rectangles)), key=lambda i: rectangles[i][1], reverse=True)
+    # Par hauteur décroissante, les rectangles de hauteur <= lh forment un
+    # suffixe de l'ordre : largeur_min[k] est la plus petite largeur de ordre[k:]
+    hauteurs = [-rectangles[i][1] for i in ordre]  # croissantes, pour bisect
+    largeur_min = [float("inf")] * (len(ordre) + 1)
+    for k in range(len(ordre) - 1, -1, -1):
+        largeur_min[k] = min(largeur_min[k + 1], rectangles[ordre[k]][0])
+
+    def fin_de_vie(libre):
+        # première étape où plus aucun rectangle restant ne rentre dans libre
+        debut = bisect_left(hauteurs, -libre[3])
+        fin = bisect_right(largeur_min, libre[2])
+        return fin if debut < fin else 0
+
+    libres = [(0, 0, W, H)]  # (x, y, largeur, hauteur)
+    fins = {libres[0]: fin_de_vie(libres[0])}
+    placements = PlacementArray() if columnar else []
+
+    for k, i in enumerate(ordre):
+        w, h = rectangles[i]
+        meilleur = None
+        for libre in libres:
+            if w <= libre[2] and h <= libre[3]:
+                score = _score_maxrects(libre, w, h, heuristique)
+                if meilleur is None or score < meilleur[0]:
+                    meilleur = (score, libre)
+        if meilleur is None:
+            continue
+        x, y = meilleur[1][0], meilleur[1][1]
+        placements.append({
+            "id": i + 1,
+            "position": (x, y),
+            "dimension": (w, h)
+        })
+
+        # Découpe des rectangles libres touchés par le rectangle posé
+        x2, y2 = x + w, y + h
+        gardes = []
+        voisins = []  # rectangles libres gardés qui touchent le rectangle posé
+        nouveaux = []
+        for libre in libres:
+            lx, ly, lw, lh = libre
+            if lx >= x2 or lx + lw <= x or ly >= y2 or ly + lh <= y:
+                if fins[libre] <= k + 1:
+                    del fins[libre]  # inutile pour les rectangles suivants
+                    continue
+                gardes.append(libre)
+                if lx <= x2 and lx + lw >= x and ly <= y2 and ly + lh >= y:
+                    voisins.append(libre)
+                continue
+            del fins[libre]
+            if lx < x:
+                nouveaux.append((lx, ly, x - lx, lh))
+            if lx + lw > x2:
+                nouveaux.append((x2, ly, lx + lw - x2, lh))
+            if ly < y:
+                nouveaux.append((lx, ly, lw, y - ly))
+            if ly + lh > y2:
+                nouveaux.append((lx, y2, lw, ly + lh - y2))
+
+        # Seuls les nouveaux morceaux peuvent être contenus dans un autre
+        # rectangle libre (les anciens étaient déjà maximaux entre eux), et
+        # un morceau longe le rectangle posé : un rectangle gardé qui le
+        # contient touche donc forcément le rectangle posé. Un rectangle libre
+        # oublié ne contient que des morceaux eux aussi inutiles.
+        nouveaux.sort(key=lambda r: r[2] * r[3], reverse=True)
+        retenus = []
+        for r in nouveaux:
+            if r in fins or fin_de_vie(r) <= k + 1:
+                continue
+            if not any(_contient(g, r) for g in retenus) and not any(_contient(g, r) for g in voisins):
+                retenus.append(r)
+                fins[r] = fin_de_vie(r)
+        libres = gardes + retenus
+
+    return placements
+
+def _contient(a, b):
+    return (a[0] <= b[0] and a[1] <= b[1]
+            and b[0] + b[2] <= a[0] + a[2] and b[1] + b[3] <= a[1] + a[3])
+
+def _borne_etageres(largeurs, W):
+    """Borne L2 (Martello et Toth) sur le nombre d'étagères de largeur W"""
+    total = sum(largeurs)
+    borne = math.ceil(total / W)
+    moitie = W / 2
+    for alpha in {l for l in largeurs if l <= moitie}:
+        grands = moyens = place_moyens = petits = 0
+        for l in largeurs:
+            if l > W - alpha:
+                grands += 1
+            elif l > moitie:
+                moyens += 1
+                place_moyens += W - l
+            elif l >= alpha:
+                petits += l
+        borne = max(borne, grands + moyens + max(0, math.ceil((petits - place_moyens) / W)))
+    return borne
+
+def brute_force_packing_2d(rectangles, W, H, max_noeuds=None, timeout=None, columnar=False):
+    """Placement exact en étagères par séparation et évaluation.
+
+    Minimise le nombre d'étagères, puis la hauteur totale. Les rectangles
+    sont traités par hauteur décroissante (chaque étagère a la hauteur de
+    celui qui l'ouvre) et gardent leur id d'origine (indice + 1).
+    La recherche part du placement de FFDH : avec max_noeuds ou timeout
+    (en secondes), elle renvoie la meilleure solution trouvée dans le
+    budget, au pire celle de FFDH.
+    Renvoie None si aucun placement complet n'existe. Avec un budget, c'est
+    aussi le cas quand FFDH dépasse la hauteur H et que le budget s'épuise
+    avant le premier placement complet.
+    """
+    n = len(rectangles)
+    ordre = sorted(range(n), key=lambda i: rectangles[i][1], reverse=True)
+    largeurs = [rectangles[i][0] for i in ordre]
+    hauteurs = [rectangles[i][1] for i in ordre]
+    if any(w > W or h > H for w, h in zip(largeurs, hauteurs)):
+        return None
+
+    largeur_cumulee = [0] * (n + 1)
+    for k in range(n):
+        largeur_cumulee[k + 1] = largeur_cumulee[k] + largeurs[k]
+    largeur_restante = [largeur_cumulee[n] - c for c in largeur_cumulee]
+
+    shelves = []  # Chaque étagère = [y_start, height, used_width]
+    etagere = [0] * n  # étagère de chaque rectangle (dans l'ordre trié)
+    impose = [False] * n  # placé par remplissage exact d'une étagère
+    meilleur = {"cout": (float("inf"), float("inf")), "etagere": None}
+    # FFDH range les rectangles dans le même ordre (tri stable par hauteur) :
+    # l'id d'un placement est le rang trié + 1 et ses étagères sont ouvertes
+    # de bas en haut
+    graine = FFDH(rectangles, W, H)
+    if len(graine) == n:
+        debuts = sorted({p["position"][1] for p in graine})
+        rang = {y: j for j, y in enumerate(debuts)}
+        meilleur["etagere"] = [0] * n
+        for p in graine:
+            meilleur["etagere"][p["id"] - 1] = rang[p["position"][1]]
+        meilleur["cout"] = (len(debuts), max(p["position"][1] + p["dimension"][1] for p in graine))
+    etat = {"noeuds": 0, "libre": 0, "hauteur": 0}
+    vus_etats = {}  # (rang, largeurs utilisées triées) -> meilleur coût partiel
+    fin = time.monotonic() + timeout if timeout is not None else None
+
+    def epuise():
+        etat["noeuds"] += 1
+        if max_noeuds is not None and etat["noeuds"] > max_noeuds:
+            return True
+        return fin is not None and etat["noeuds"] % 1024 == 0 and time.monotonic() > fin
+
+    def placer(k):
+        if k == n:
+            cout = (len(shelves), etat["hauteur"])
+            if cout < meilleur["cout"]:
+                meilleur["cout"] = cout
+                meilleur["etagere"] = etagere[:]
+            return False
+        if epuise():
+            return True
+
+        # Bornes : la largeur qui ne tient pas dans les étagères ouvertes
+        # demande de nouvelles étagères (borne L2 où la partie occupée de
+        # chaque étagère ouverte compte comme un objet déjà posé)
+        manque = largeur_restante[k] - etat["libre"]
+        nouvelles = math.ceil(manque / W) if manque > 0 else 0
+        if len(shelves) + nouvelles < meilleur["cout"][0]:
+            total = _borne_etageres([shelf[2] for shelf in shelves] + largeurs[k:], W)
+            nouvelles = max(nouvelles, total - len(shelves))
+        # Les plus hauts rectangles restants remplissent d'abord les étagères
+        # ouvertes ; la i-ème nouvelle étagère est au moins aussi haute que
+        # le rectangle qui couvre la position libre + i * W
+        hauteur_min = etat["hauteur"]
+        position = etat["libre"]
+        while position < largeur_restante[k]:
+            j = bisect_right(largeur_cumulee, largeur_cumulee[k] + position) - 1
+            hauteur_min += hauteurs[j]
+            position += W
+        if hauteur_min > H or (len(shelves) + nouvelles, hauteur_min) >= meilleur["cout"]:
+            return False
+
+        w, h = largeurs[k], hauteurs[k]
+        # rectangles identiques : étagères dans l'ordre, pour ne pas énumérer leurs permutations
+        # (sauf si le précédent a été imposé par un remplissage exact)
+        debut = 0
+        if k and largeurs[k - 1] == w and hauteurs[k - 1] == h and not impose[k - 1]:
+            debut = etagere[k - 1]
+
+        # même état déjà atteint à un coût au plus égal : inutile de continuer
+        cle = (k, tuple(sorted(shelf[2] for shelf in shelves[:debut])),
+               tuple(sorted(shelf[2] for shelf in shelves[debut:])))
+        cout = (len(shelves), etat["hauteur"])
+        ancien = vus_etats.get(cle)
+        if ancien is not None and ancien[0] <= cout[0] and ancien[1] <= cout[1]:
+            return False
+        vus_etats[cle] = cout
+
+        candidates = []
+        parfait = False
+        vus = set()
+        for j in range(debut, len(shelves)):
+            y_start, shelf_height, used_width = shelves[j]
+            # les rectangles restants sont moins hauts que toutes les étagères :
+            # deux étagères de même largeur utilisée sont équivalentes
+            if used_width + w <= W and used_width not in vus:
+                vus.add(used_width)
+                if used_width + w == W:
+                    candidates = [j]  # remplir exactement une étagère domine
+                    parfait = True
+                    break
+                candidates.append(j)
+
+        impose[k] = parfait
+        for j in candidates:
+            shelf = shelves[j]
+            shelf[2] += w
+            etat["libre"] -= w
+            etagere[k] = j
+            arret = placer(k + 1)
+            shelf[2] -= w
+            etat["libre"] += w
+            if arret:
+                return True
 
         # Essayer de créer une nouvelle étagère
-        current_y = sum(s[1] for s in shelves)
-        if current_y + h <= H:
-            new_placements = copy.deepcopy(placements)
-            new_shelves = copy.deepcopy(shelves)
-            new_shelves.append([current_y, h, w])
-            new_placements.append({
-                "id": index + 1,
-                "position": (0, current_y),
-                "dimension": (w, h)
-            })
-            placer(index + 1, new_placements, new_shelves)
+        if not parfait and etat["hauteur"] + h <= H:
+            shelves.append([etat["hauteur"], h, w])
+            etat["hauteur"] += h
+            etat["libre"] += W - w
+            etagere[k] = len(shelves) - 1
+            arret = placer(k + 1)
+            shelves.pop()
+            etat["hauteur"] -= h
+            etat["libre"] -= W - w
+            if arret:
+                return True
+        return False
+
+    placer(0)
+    if meilleur["etagere"] is None:
+        return None
+
+    # Reconstruction des positions à partir des étagères retenues
+    placements = []
+    positions = []  # [y_start, used_width] de chaque étagère
+    hauteur = 0
+    for k, j in enumerate(meilleur["etagere"]):
+        if j == len(positions):
+            positions.append([hauteur, 0])
+            hauteur += hauteurs[k]
+        y_start, used_width = positions[j]
+        placements.append({
+            "id": ordre[k] + 1,
+            "position": (used_width, y_start),
+            "dimension": (largeurs[k], hauteurs[k])
+        })
+        positions[j][1] += largeurs[k]
 
-    placer(0, [], [])
-    return meilleur["placements"]
+    placements.sort(key=lambda p: p["id"])
+    return PlacementArray(placements) if columnar else placements
 
 def dessiner_interface(W, H, placements, scale_x=40, scale_y=15, padding=10):
+    import tkinter as tk
+
     fenetre = tk.Tk()
     fenetre.title("Placement NFDH - Grille 2D")
 
@@ -1,88 +1,299 @@
+import importlib
 import itertools
 import math
+import multiprocessing
 import time
-from copy import deepcopy
-import tkinter as tk
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-def brute_force_packing(shapes, W, H, timeout=10):
-    """Algorithme brute force avec backtracking récursif"""
-    start_time = time.time()
-    best_solution = {'height': float('inf'), 'placements': []}
+from index_spatial import IndexSpatial
+
+def orientations(shape):
+    """Rotations donnant des placements différents.
+
+    Les collisions ne dépendent que du rectangle englobant (cercle mis à
+    part) : pi et 3*pi/2 redonnent ceux de 0 et pi/2, et une forme à
+    englobant carré n'a qu'une orientation. On garde la première rotation
+    de chaque classe, celle que l'énumération complète aurait retenue.
+    """
+    if shape["type"] == "cercle":
+        return [0]  # Pas de rotation pour les cercles
+    w, h = shape["dimension"]
+    return [0] if w == h else [0, math.pi/2]
+
+def permutations_distinctes(shapes, prefixe=(), longueur=None):
+    """Permutations des indices, à l'échange près de formes identiques.
+
+    Seule la première (dans l'ordre lexicographique) de chaque classe est
+    produite : parmi des formes identiques, on prend toujours la plus petite
+    non encore utilisée. Avec prefixe, seules les permutations qui
+    commencent ainsi ; avec longueur, les débuts distincts de cette longueur.
+    """
     n = len(shapes)
-    
-    # Générer toutes les permutations des formes
-    for perm in itertools.permutations(range(n)):
-        # Toutes les combinaisons de rotations possibles
-        rotations = []
-        for i in perm:
-            if shapes[i]["type"] == "cercle":
-                rotations.append([0])  # Pas de rotation pour les cercles
-            else:
-                rotations.append([0, math.pi/2, math.pi, 3*math.pi/2])
-        
+    longueur = n if longueur is None else min(longueur, n)
+    cles = [(s["type"], tuple(s["dimension"])) for s in shapes]
+    utilise = [False] * n
+    for i in prefixe:
+        utilise[i] = True
+    perm = list(prefixe)
+
+    def suivant():
+        if len(perm) >= longueur:
+            yield tuple(perm)
+            return
+        vues = set()
+        for i in range(n):
+            if utilise[i] or cles[i] in vues:
+                continue
+            vues.add(cles[i])
+            utilise[i] = True
+            perm.append(i)
+            yield from suivant()
+            perm.pop()
+            utilise[i] = False
+
+    return suivant()
+
+def _boite(shape):
+    # ici un cercle est inscrit dans son carré englobant, comme les autres formes
+    x, y = shape["position"]
+    return (x, y, x + shape["width"], y + shape["height"])
+
+class GrilleOccupation:
+    """Grille d'occupation du bac (cases couvertes par les rectangles englobants).
+
+    Chaque ligne du bac est un entier dont les bits sont les cases occupées :
+    savoir si une boîte est libre ou la marquer occupée ne coûte qu'un ET ou
+    un OU par ligne. La grille est prudente : une boîte qui touche une case
+    occupée n'est pas forcément en collision (cercles), les formes posées
+    sont donc gardées pour la vérification exacte.
+    """
+
+    def __init__(self, W, H):
+        self.W, self.H = W, H
+        self.lignes = [0] * H
+        self.formes = []
+        self.index = IndexSpatial(max(1, min(W, H) / 8))
+        self.cercles = 0
+        # coins candidats : bords gauche/haut du bac et bords droit/bas des formes
+        self.xs = {0}
+        self.ys = {0}
+
+    def _masque(self, x, w):
+        x2 = min(self.W, math.ceil(x + w))
+        return ((1 << (x2 - x)) - 1) << x
+
+    def libre(self, x, y, w, h):
+        masque = self._masque(x, w)
+        return not any(ligne & masque for ligne in self.lignes[y:min(self.H, math.ceil(y + h))])
+
+    def ajouter(self, shape):
+        x, y = shape["position"]
+        x2, y2 = math.ceil(x + shape["width"]), math.ceil(y + shape["height"])
+        masque = self._masque(x, shape["width"])
+        for ligne in range(y, min(self.H, y2)):
+            self.lignes[ligne] |= masque
+        self.formes.append(shape)
+        self.index.inserer(shape, _boite(shape))
+        self.cercles += shape["type"] == "cercle"
+        self.xs.add(x2)
+        self.ys.add(y2)
+
+    def collision(self, shape):
+        x, y = shape["position"]
+        if self.libre(x, y, shape["width"], shape["height"]):
+            return False
+        # entre englobants, seul un cercle peut laisser de la place
+        if not self.cercles and shape["type"] != "cercle":
+            return True
+        return any(shapes_overlap(shape, placed) for placed in self.index.candidats(_boite(shape)))
+
+    def premier_coin_libre(self, shape):
+        """Première position (y puis x croissants) où la forme se pose.
+
+        Entre rectangles englobants, c'est forcément un coin candidat. Un
+        cercle, posé ou à poser, peut se loger dans l'englobant d'une autre
+        forme : on balaie alors toutes les positions entières.
+        """
+        w, h = shape["width"], shape["height"]
+        if self.cercles or shape["type"] == "cercle":
+            xs = range(self.W - int(w) + 1)
+            ys = range(self.H - int(h) + 1)
+        else:
+            xs = sorted(x for x in self.xs if x <= self.W - int(w))
+            ys = sorted(y for y in self.ys if y <= self.H - int(h))
+        for y in ys:
+            for x in xs:
+                shape["position"] = (x, y)
+                if not self.collision(shape):
+                    return x, y
+        return None
+
+def _dimensions(shape, rotation):
+    # Dimensions après rotation
+    if shape["type"] == "cercle":
+        return shape["dimension"][0], shape["dimension"][0]
+    w, h = shape["dimension"]
+    if rotation in [math.pi/2, 3*math.pi/2]:
+        w, h = h, w
+    return w, h
+
+def placer_sequence(shapes, perm, rot_combo, W, H, limite=float("inf")):
+    """Pose les formes dans l'ordre de perm avec les rotations données.
+
+    Renvoie (placements, hauteur) ou None si une forme ne trouve pas de place
+    ou si la hauteur atteint limite (la solution ne serait pas meilleure).
+    """
+    grille = GrilleOccupation(W, H)
+    current_height = 0
+    for idx, (shape_idx, rotation) in enumerate(zip(perm, rot_combo)):
+        shape = dict(shapes[shape_idx])
+        shape['id'] = idx + 1
+        shape['rotation'] = rotation
+
+        w, h = _dimensions(shape, rotation)
+
+        # Vérifier si la forme est trop grande
+        if w > W or h > H:
+            return None
+
+        shape['width'] = w
+        shape['height'] = h
+        position = grille.premier_coin_libre(shape)
+        if position is None:
+            return None
+        grille.ajouter(shape)
+        current_height = max(current_height, position[1] + h)
+        if current_height >= limite:
+            return None  # élagage : déjà aussi haut que la meilleure solution
+
+    return grille.formes, current_height
+
+def depart_heuristique(shapes, W, H):
+    """Meilleure solution complète de BestFit / FFDH (2DPackingMultiForm), ou None.
+
+    Les placements sont remis au format de la recherche et revérifiés avec
+    ses propres règles de collision (un cercle part du coin de son carré).
+    """
+    multiforme = importlib.import_module("2DPackingMultiForm")
+    meilleur = None
+    for heuristique in (multiforme.BestFit, multiforme.FFDH):
+        placements = []
+        for k, p in enumerate(heuristique(shapes, W, H)):
+            w, h = _dimensions(p, p.get("rotation", 0))
+            placements.append({"type": p["type"], "dimension": p["dimension"], "id": k + 1,
+                               "rotation": p.get("rotation", 0), "position": p["position"],
+                               "width": w, "height": h})
+        if len(placements) != len(shapes):
+            continue
+        if any(p["position"][0] < 0 or p["position"][1] < 0 or p["position"][0] + p["width"] > W
+               or p["position"][1] + p["height"] > H for p in placements):
+            continue
+        if any(shapes_overlap(p, q) for p, q in itertools.combinations(placements, 2)):
+            continue
+        hauteur = max(p["position"][1] + p["height"] for p in placements)
+        if meilleur is None or hauteur < meilleur[0]:
+            meilleur = (hauteur, placements)
+    return meilleur
+
+def brute_force_packing(shapes, W, H, timeout=10, anytime=False, amelioration=None):
+    """Algorithme brute force : toutes les permutations et orientations distinctes,
+    chaque forme posée sur le premier coin bas-gauche libre.
+
+    Un placement partiel est abandonné dès qu'il atteint la hauteur de la
+    meilleure solution. Avec anytime, la recherche part de la meilleure
+    solution des heuristiques (BestFit, FFDH), toujours renvoyée si rien de
+    mieux n'est trouvé avant timeout. amelioration(hauteur, placements) est
+    appelée à chaque nouvelle meilleure solution.
+    """
+    depart = depart_heuristique(shapes, W, H) if anytime else None
+    if depart and amelioration:
+        amelioration(*depart)
+    limite = depart[0] if depart else float("inf")
+
+    def publier(hauteur, placements):
+        if amelioration:
+            amelioration(hauteur, placements)
+
+    meilleur = _meilleur_prefixe(shapes, W, H, (), time.time() + timeout, lambda: limite, publier)
+    meilleur = meilleur or depart
+    return meilleur[1] if meilleur else []
+
+def _meilleur_prefixe(shapes, W, H, prefixe, echeance, limite, publier):
+    """Meilleure solution parmi les permutations qui commencent par prefixe.
+
+    limite() donne la hauteur à battre venue d'ailleurs (départ heuristique,
+    autres processus) ; publier(hauteur, placements) reçoit chaque amélioration.
+    """
+    meilleur = None
+    for perm in permutations_distinctes(shapes, prefixe):
+        rotations = [orientations(shapes[i]) for i in perm]
         for rot_combo in itertools.product(*rotations):
-            if time.time() - start_time > timeout:
-                return best_solution['placements']
-                
-            placements = []
-            current_height = 0
-            valid = True
-            
-            # Essayer de placer chaque forme dans l'ordre
-            for idx, (shape_idx, rotation) in enumerate(zip(perm, rot_combo)):
-                shape = deepcopy(shapes[shape_idx])
-                shape['id'] = idx + 1
-                shape['rotation'] = rotation
-                
-                # Calculer les dimensions après rotation
-                if shape["type"] in ["rectangle", "triangle"]:
-                    w, h = shape["dimension"]
-                    if rotation in [math.pi/2, 3*math.pi/2]:
-                        w, h = h, w
-                elif shape["type"] == "cercle":
-                    w = h = shape["dimension"][0]
-                
-                # Vérifier si la forme est trop grande
-                if w > W or h > H:
-                    valid = False
-                    break
-                
-                # Trouver une position valide sans collision
-                position_found = False
-                for y in range(0, H - int(h) + 1):
-                    for x in range(0, W - int(w) + 1):
-                        shape['position'] = (x, y)
-                        shape['width'] = w
-                        shape['height'] = h
-                        
-                        # Vérifier les collisions
-                        collision = False
-                        for placed_shape in placements:
-                            if shapes_overlap(shape, placed_shape):
-                                collision = True
-                                break
-                        
-                        if not collision:
-                            placements.append(deepcopy(shape))
-                            position_found = True
-                            current_height = max(current_height, y + h)
-                            break
-                    if position_found:
-                        break
-                
-                if not position_found:
-                    valid = False
-                    break
-            
-            # Si toutes les formes placées et solution meilleure
-            if valid and len(placements) == n:
-                if current_height < best_solution['height']:
-                    best_solution = {
-                        'height': current_height,
-                        'placements': deepcopy(placements)
-                    }
-    
-    return best_solution['placements']
+            if echeance is not None and time.time() > echeance:
+                return meilleur
+            borne = min(limite(), meilleur[0]) if meilleur else limite()
+            resultat = placer_sequence(shapes, perm, rot_combo, W, H, borne)
+            if resultat is not None:
+                meilleur = (resultat[1], resultat[0])
+                publier(resultat[1], resultat[0])
+    return meilleur
+
+_partage = {}
+
+def _initialiser_processus(hauteur, echeance):
+    _partage["hauteur"] = hauteur
+    _partage["echeance"] = echeance
+
+def _limite():
+    # À hauteur égale on continue : le départage se fait par rang du début
+    return math.nextafter(_partage["hauteur"].value, math.inf)
+
+def _publier(hauteur, placements):
+    # Hauteur partagée entre processus : la meilleure trouvée jusqu'ici
+    partagee = _partage["hauteur"]
+    if hauteur < partagee.value:
+        with partagee.get_lock():
+            if hauteur < partagee.value:
+                partagee.value = hauteur
+
+def _explorer_prefixe(shapes, W, H, prefixe):
+    return _meilleur_prefixe(shapes, W, H, prefixe, _partage["echeance"], _limite, _publier)
+
+def brute_force_packing_parallele(shapes, W, H, timeout=10, profondeur=1, processus=None,
+                                  anytime=False, amelioration=None):
+    """brute_force_packing réparti sur un pool de processus.
+
+    Les permutations sont découpées selon leurs `profondeur` premières
+    formes ; chaque début est exploré par un processus. La meilleure hauteur
+    est partagée en mémoire. Passé timeout secondes (échéance commune à
+    tous les processus), on renvoie la meilleure solution trouvée. À hauteur
+    égale, on garde celle que la recherche séquentielle aurait trouvée.
+    anytime et amelioration comme pour brute_force_packing ; amelioration
+    est appelée dans ce processus, à la fin de chaque début exploré.
+    """
+    if not shapes:
+        return []
+    echeance = time.time() + timeout if timeout is not None else None
+    depart = depart_heuristique(shapes, W, H) if anytime else None
+    if depart and amelioration:
+        amelioration(*depart)
+    hauteur = multiprocessing.Value("d", depart[0] if depart else float("inf"))
+    prefixes = list(permutations_distinctes(shapes, longueur=profondeur))
+
+    # (hauteur, rang du début, placements) ; le départ heuristique passe
+    # avant tous les débuts à hauteur égale
+    meilleur = (depart[0], -1, depart[1]) if depart else None
+    with ProcessPoolExecutor(processus, initializer=_initialiser_processus,
+                             initargs=(hauteur, echeance)) as executeur:
+        futures = {executeur.submit(_explorer_prefixe, shapes, W, H, prefixe): rang
+                   for rang, prefixe in enumerate(prefixes)}
+        for future in as_completed(futures):
+            resultat = future.result()
+            if resultat is not None and (meilleur is None or (resultat[0], futures[future]) < meilleur[:2]):
+                if amelioration and (meilleur is None or resultat[0] < meilleur[0]):
+                    amelioration(resultat[0], resultat[1])
+                meilleur = (resultat[0], futures[future], resultat[1])
+
+    return meilleur[2] if meilleur else []
 
 def rect_circle_collision(rect, circle):
     """Vérifie la collision entre un rectangle et un cercle"""
@@ -146,6 +357,8 @@ def shapes_overlap(shape1, shape2):
                    y1 + h1 <= y2 or y2 + h2 <= y1)
 
 def dessiner_interface(W, H, placements, scale=40, padding=10):
+    import tkinter as tk
+
     fenetre = tk.Tk()
     fenetre.title("Placement Brute Force")
     
@@ -1,7 +1,9 @@
-import tkinter as tk
 import math
 from copy import deepcopy
 
+from index_spatial import IndexSpatial
+from placements import PlacementArray
+
 def test_rotations(shape, W, H):
     """Teste les différentes rotations et retourne la meilleure configuration"""
     if shape["type"] == "cercle":
@@ -29,7 +31,7 @@ def test_rotations(shape, W, H):
     optimized_shape["rotation"] = best_rotation
     return optimized_shape
 
-def NFDH(shapes, W, H):
+def NFDH(shapes, W, H, columnar=False):
     optimized_shapes = [test_rotations(s, W, H) for s in shapes]
 
     def shape_height(s):
@@ -42,7 +44,7 @@ def NFDH(shapes, W, H):
 
     optimized_shapes.sort(key=shape_height, reverse=True)
 
-    placements = []
+    placements = PlacementArray() if columnar else []
     current_shelf_y = 0
     current_shelf_height = 0
     current_x = 0
@@ -82,7 +84,7 @@ def NFDH(shapes, W, H):
 
     return placements
 
-def FFDH(shapes, W, H):
+def FFDH(shapes, W, H, columnar=False):
     """First-Fit Decreasing Height algorithm with rotation support"""
     
     # 1. Test all possible rotations for each shape
@@ -100,7 +102,7 @@ def FFDH(shapes, W, H):
     optimized_shapes.sort(key=get_height, reverse=True)
     
     # 3. Initialize shelves
-    placements = []
+    placements = PlacementArray() if columnar else []
     shelves = []  # List of (y_position, remaining_width, shelf_height)
     
     for i, shape in enumerate(optimized_shapes):
@@ -214,6 +216,19 @@ def shapes_overlap(shape1, shape2):
     # Cas par défaut (pas de collision)
     return False
 
+def _boite(shape):
+    """Boîte englobante prudente pour l'index spatial.
+
+    shapes_overlap voit un cercle centré sur sa position face aux
+    rectangles et aux cercles, mais comme un carré partant de sa position
+    face aux triangles : la boîte couvre les deux.
+    """
+    x, y = shape["position"]
+    if shape["type"] == "cercle":
+        r = shape["dimension"][0] / 2
+        return (x - r, y - r, x + shape["width"], y + shape["height"])
+    return (x, y, x + shape["width"], y + shape["height"])
+
 def merge_overlapping_spaces(spaces):
     """Fusionne les espaces vides qui se chevauchent"""
     merged = True
@@ -252,7 +267,7 @@ def merge_overlapping_spaces(spaces):
     
     return spaces
 
-def BestFit(shapes, W, H):
+def BestFit(shapes, W, H, columnar=False):
     """Algorithme Best-Fit pour le bin packing 2D avec support de rotation et vérification des collisions"""
     # 1. Tester toutes les rotations possibles et trier par aire décroissante
     optimized_shapes = []
@@ -275,6 +290,7 @@ def BestFit(shapes, W, H):
     # 2. Initialiser les espaces vides
     empty_spaces = [{"x": 0, "y": 0, "w": W, "h": H}]
     placements = []
+    index = IndexSpatial(max(1, min(W, H) / 8))  # formes posées, pour les collisions
     
     for i, shape in enumerate(optimized_shapes):
         # Déterminer les dimensions après rotation
@@ -311,9 +327,9 @@ def BestFit(shapes, W, H):
                         "height": h
                     }
                     
-                    # Vérifier les collisions avec les placements existants
+                    # Vérifier les collisions avec les placements voisins
                     collision = False
-                    for placed in placements:
+                    for placed in index.candidats(_boite(potential_placement)):
                         if shapes_overlap(potential_placement, placed):
                             collision = True
                             break
@@ -340,6 +356,7 @@ def BestFit(shapes, W, H):
                 "width": w,
                 "height": h
             })
+            index.inserer(placements[-1], _boite(placements[-1]))
             
             # Découper l'espace restant
             used_space = empty_spaces.pop(best_space_idx)
@@ -376,10 +393,13 @@ def BestFit(shapes, W, H):
             empty_spaces.extend(new_spaces)
             empty_spaces = merge_overlapping_spaces(empty_spaces)
     
-    return placements
+    # les collisions se testent sur les dictionnaires : conversion à la fin
+    return PlacementArray(placements) if columnar else placements
 
 
 def dessiner_interface(W, H, placements, scale=40, padding=10):
+    import tkinter as tk
+
     fenetre = tk.Tk()
     fenetre.title("Placement optimal avec rotation automatique")
 
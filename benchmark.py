@@ -0,0 +1,233 @@
+"""Banc d'essai reproductible de tous les algorithmes de placement.
+
+Exemples :
+    python benchmark.py --sortie base.json
+    python benchmark.py --comparer base.json
+
+Chaque cas est lancé sur des instances générées avec une graine fixe, à
+tailles croissantes. On mesure le temps (meilleur de plusieurs essais), le
+pic mémoire (tracemalloc) et la qualité : nombre de bacs ou hauteur
+rapportés à une borne inférieure.
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from packing import charger_module
+
+# ---------------------------------------------------------------- générateurs
+
+def uniforme_1d(n, graine, capacite=100):
+    rng = random.Random(graine)
+    return {"objets": [rng.randint(1, capacite) for _ in range(n)], "capacite": capacite}
+
+def triplets_1d(n, graine, capacite=1000):
+    """Triplets à la Falkenauer : chaque bac optimal contient exactement
+    trois objets de taille comprise entre 250 et 500 qui le remplissent"""
+    rng = random.Random(graine)
+    objets = []
+    for _ in range(max(1, n // 3)):
+        a = rng.randint(380, 490)
+        b = rng.randint(250, (capacite - a) // 2)
+        objets += [a, b, capacite - a - b]
+    rng.shuffle(objets)
+    return {"objets": objets, "capacite": capacite}
+
+def rectangles_2d(n, graine, largeur=100):
+    """Rectangles de tailles asymétriques : beaucoup de petits, quelques grands"""
+    rng = random.Random(graine)
+    rectangles = []
+    for _ in range(n):
+        w = min(largeur, max(1, int(rng.paretovariate(1.5) * 5)))
+        h = min(largeur, max(1, int(rng.paretovariate(1.5) * 5)))
+        rectangles.append((w, h))
+    return {"rectangles": rectangles, "largeur": largeur, "hauteur": 10 * n * largeur}
+
+def formes_mixtes(n, graine, largeur=20):
+    rng = random.Random(graine)
+    formes = []
+    for _ in range(n):
+        type_forme = rng.choice(["rectangle", "triangle", "cercle"])
+        if type_forme == "cercle":
+            formes.append({"type": "cercle", "dimension": (rng.randint(1, largeur // 4),)})
+        else:
+            formes.append({"type": type_forme,
+                           "dimension": (rng.randint(1, largeur // 2), rng.randint(1, largeur // 2))})
+    return {"formes": formes, "largeur": largeur, "hauteur": 5 * n * largeur}
+
+def formes_petites(n, graine):
+    # le coût de brute_force_packing vient des n! ordres de pose, et dès qu'un
+    # cercle est posé chaque pose balaie les W x H positions : on garde le conteneur petit
+    instance = formes_mixtes(n, graine, largeur=12)
+    instance["hauteur"] = 24
+    return instance
+
+# ---------------------------------------------------------------- qualité
+
+def _nb_bacs(resultat):
+    if isinstance(resultat[0], int):
+        return resultat[0]
+    return max((bac for _, _, bac in resultat[1]), default=0)
+
+def _hauteur(placement):
+    dimension = placement["dimension"]
+    if placement.get("type") == "cercle":
+        return dimension[0]
+    if placement.get("rotation", 0) in (math.pi/2, 3*math.pi/2):
+        return dimension[0]
+    return dimension[1]
+
+def _aire(forme):
+    dimension = forme["dimension"]
+    if forme["type"] == "cercle":
+        return dimension[0] ** 2  # carré englobant
+    return dimension[0] * dimension[1]
+
+def evaluer(famille, instance, resultat):
+    """Renvoie (valeur, borne inférieure, nombre d'objets placés, nombre d'objets).
+
+    En 2D, la borne ne porte que sur les objets placés : un solveur qui en
+    laisse de côté est comparé à ce qu'il a réellement rangé.
+    """
+    if famille == "1d":
+        objets, capacite = instance["objets"], instance["capacite"]
+        return _nb_bacs(resultat), math.ceil(sum(objets) / capacite), len(objets), len(objets)
+
+    largeur = instance["largeur"]
+    placements = list(resultat or [])
+    if not placements:
+        return 0, 0, 0, len(instance["rectangles" if famille == "2d" else "formes"])
+    if famille == "2d":
+        # 2D.py ne tourne jamais les rectangles
+        aire = sum(p["dimension"][0] * p["dimension"][1] for p in placements)
+        plus_haut = max(p["dimension"][1] for p in placements)
+        n = len(instance["rectangles"])
+    else:
+        aire = sum(_aire(p) for p in placements)
+        plus_haut = max(min(p["dimension"]) for p in placements)
+        n = len(instance["formes"])
+    hauteur = max(p["position"][1] + _hauteur(p) for p in placements)
+    return hauteur, max(math.ceil(aire / largeur), plus_haut), len(placements), n
+
+# ---------------------------------------------------------------- cas
+
+# nom -> (famille, module, fonction, générateur, tailles, tailles rapides)
+CAS = {
+    "ff/uniforme": ("1d", "1D", "first_fit", uniforme_1d, [1000, 10000, 100000], [1000]),
+    "bf/uniforme": ("1d", "1D", "best_fit", uniforme_1d, [1000, 10000, 100000], [1000]),
+    "wf/uniforme": ("1d", "1D", "worst_fit", uniforme_1d, [1000, 10000, 100000], [1000]),
+    "ff/triplets": ("1d", "1D", "first_fit", triplets_1d, [999, 9999], [99]),
+    "exact/triplets": ("1d", "1D_fb", "bin_packing_all_combinations", triplets_1d, [30, 45, 60], [30]),
+    "exact/uniforme": ("1d", "1D_fb", "bin_packing_all_combinations", uniforme_1d, [20, 40, 75], [20]),
+    "nfdh/asymetrique": ("2d", "2D", "NFDH", rectangles_2d, [1000, 10000, 50000], [1000]),
+    "ffdh/asymetrique": ("2d", "2D", "FFDH", rectangles_2d, [1000, 10000, 50000], [1000]),
+    "bfdh/asymetrique": ("2d", "2D", "BFDH", rectangles_2d, [1000, 10000, 50000], [1000]),
+    "brute_force/formes": ("formes", "2DPackingBruteForce", "brute_force_packing", formes_petites,
+                           [3, 4, 5], [3]),
+    "bestfit/formes": ("formes", "2DPackingMultiForm", "BestFit", formes_mixtes, [50, 100, 200], [50]),
+}
+
+def lancer(fonction, famille, instance):
+    if famille == "1d":
+        return fonction(instance["objets"], instance["capacite"])
+    donnees = instance["rectangles"] if famille == "2d" else instance["formes"]
+    return fonction(donnees, instance["largeur"], instance["hauteur"])
+
+def mesurer(nom, taille, graine=0, repetitions=3):
+    famille, module, nom_fonction, generateur, _, _ = CAS[nom]
+    fonction = getattr(charger_module(module), nom_fonction)
+    instance = generateur(taille, graine)
+
+    temps = float("inf")
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        resultat = lancer(fonction, famille, instance)
+        temps = min(temps, time.perf_counter() - debut)
+
+    tracemalloc.start()
+    lancer(fonction, famille, instance)
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    valeur, borne, places, objets = evaluer(famille, instance, resultat)
+    return {
+        "temps": temps,
+        "memoire": pic,
+        "valeur": valeur,
+        "borne": borne,
+        "qualite": valeur / borne if borne else 1.0,
+        "places": places,
+        "objets": objets,
+    }
+
+def executer(noms=None, rapide=False, graine=0, repetitions=3, afficher=print):
+    resultats = {}
+    for nom in noms or CAS:
+        tailles = CAS[nom][5] if rapide else CAS[nom][4]
+        for taille in tailles:
+            mesure = mesurer(nom, taille, graine, repetitions)
+            resultats[f"{nom}/{taille}"] = mesure
+            ligne = (f"{nom:22} n={taille:<7} {mesure['temps']:9.4f} s "
+                     f"{mesure['memoire'] / 1e6:8.2f} Mo  qualité {mesure['qualite']:.3f}")
+            if mesure["places"] < mesure["objets"]:
+                ligne += f"  placés {mesure['places']}/{mesure['objets']}"
+            afficher(ligne)
+    return {
+        "meta": {"graine": graine, "python": platform.python_version(), "machine": platform.machine()},
+        "resultats": resultats,
+    }
+
+def comparer(base, actuel, tolerance=0.2):
+    """Liste des régressions de temps, de mémoire ou de qualité par rapport à base"""
+    regressions = []
+    for cle, mesure in actuel["resultats"].items():
+        ancienne = base["resultats"].get(cle)
+        if ancienne is None:
+            continue
+        for critere in ("temps", "memoire"):
+            # les mesures très courtes sont trop bruitées pour être comparées
+            if critere == "temps" and ancienne[critere] < 1e-3:
+                continue
+            if mesure[critere] > ancienne[critere] * (1 + tolerance):
+                regressions.append(f"{cle} : {critere} {ancienne[critere]:.4g} -> {mesure[critere]:.4g}")
+        if mesure["qualite"] > ancienne["qualite"] or mesure["places"] < ancienne["places"]:
+            regressions.append(f"{cle} : qualité {ancienne['qualite']:.4f} -> {mesure['qualite']:.4f}, "
+                               f"placés {ancienne['places']} -> {mesure['places']}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai des algorithmes de placement")
+    parser.add_argument("cas", nargs="*", help=f"cas à lancer (défaut : tous) parmi {', '.join(CAS)}")
+    parser.add_argument("--rapide", action="store_true", help="petites tailles seulement")
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--sortie", help="fichier JSON où écrire les résultats")
+    parser.add_argument("--comparer", help="fichier JSON de référence")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    inconnus = [nom for nom in args.cas if nom not in CAS]
+    if inconnus:
+        parser.error(f"cas inconnus : {', '.join(inconnus)}")
+
+    actuel = executer(args.cas, args.rapide, args.graine, args.repetitions)
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as f:
+            json.dump(actuel, f, indent=2, ensure_ascii=False)
+
+    if args.comparer:
+        with open(args.comparer, encoding="utf-8") as f:
+            base = json.load(f)
+        regressions = comparer(base, actuel, args.tolerance)
+        for ligne in regressions:
+            print("RÉGRESSION", ligne)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Cache des résultats de solveurs, adressé par le contenu de l'instance.
+
+La clé est l'empreinte sha256 des objets (tailles ou formes), des
+dimensions du conteneur, du solveur et de ses options. Le résultat est
+celui qu'aurait renvoyé l'appel direct :
+    - la plupart des solveurs dépendent de l'ordre des objets (First Fit,
+      étagères à hauteur égale, BestFit, ...) : la clé suit l'ordre de
+      l'appelant et le solveur est lancé sur cet ordre ;
+    - ceux de INVARIANTS (versions décroissantes, solveurs exacts 1D)
+      donnent la même réponse dans tout ordre : la clé est le multiensemble
+      trié, le solveur est lancé sur cet ordre canonique et les ids du
+      résultat sont rendus aux objets de l'appelant (indice d'origine + 1).
+Une copie est renvoyée : modifier le résultat ne touche pas au cache.
+
+Les résultats vivent dans un LRU en mémoire, doublé d'un dossier sur
+disque dont la taille totale est bornée (les fichiers les moins récemment
+utilisés sont supprimés).
+
+Exemple :
+    cache = Cache(dossier=".cache_packing")
+    bins, placements = cache.resoudre("1D", "first_fit", objets, 10)
+    placements_2d = cache.resoudre("2D", "FFDH", rectangles, W, H)
+"""
+import copy
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+
+from packing import charger_module
+from placements import PlacementArray
+
+# Marque une clé absente du cache (None est un résultat possible)
+_ABSENT = object()
+
+# Solveurs dont le résultat ne dépend que du multiensemble des objets
+INVARIANTS = {
+    ("1D", "first_fit_decreasing"), ("1D", "best_fit_decreasing"), ("1D", "worst_fit_decreasing"),
+    ("1D_fb", "bin_packing_all_combinations"), ("1D_fb", "bin_packing_parallele"),
+    ("1D_fb", "bin_packing_dp"),
+}
+
+def _cle_forme(objet):
+    if isinstance(objet, dict):
+        return (objet["type"], tuple(objet["dimension"]))
+    if isinstance(objet, (tuple, list)):
+        return tuple(objet)
+    return objet
+
+def canonique(donnees):
+    """Ordre canonique des objets : indices d'origine triés par taille ou forme"""
+    return sorted(range(len(donnees)), key=lambda i: _cle_forme(donnees[i]), reverse=True)
+
+def empreinte(module, fonction, donnees, dimensions, options, ordre):
+    contenu = json.dumps({
+        "solveur": f"{module}.{fonction}",
+        "objets": [_cle_forme(donnees[i]) for i in ordre],
+        "dimensions": list(dimensions),
+        "options": sorted(options.items()),
+    }, separators=(",", ":"), default=str)
+    return hashlib.sha256(contenu.encode("utf-8")).hexdigest()
+
+def _reidentifier(resultat, donnees, ordre):
+    """Remet les ids d'un résultat calculé sur l'ordre canonique aux objets de l'appelant"""
+    if isinstance(resultat, tuple) and len(resultat) == 2 and isinstance(resultat[1], list) \
+            and not isinstance(resultat[0], int):
+        # 1D heuristique : (bins, placements), ids = position canonique + 1
+        bins, placements = resultat
+        vers = {k + 1: i + 1 for k, i in enumerate(ordre)}
+        # le tri canonique est stable : à taille égale, l'ordre des ids est conservé
+        bins = [[(vers[idx], taille) for idx, taille in b] for b in bins]
+        placements = [(vers[idx], taille, bac) for idx, taille, bac in placements]
+        return bins, placements
+
+    return copy.deepcopy(resultat)  # solveurs exacts 1D : (nb, bacs de tailles), sans ids
+
+class Cache:
+    def __init__(self, capacite=1024, dossier=None, taille_max_disque=256 * 2**20):
+        self.capacite = capacite
+        self.memoire = OrderedDict()  # empreinte -> résultat canonique
+        self.dossier = dossier
+        self.taille_max_disque = taille_max_disque
+        self.succes = self.echecs = 0
+        if dossier:
+            os.makedirs(dossier, exist_ok=True)
+            self.taille_disque = sum(e.stat().st_size for e in os.scandir(dossier) if e.is_file())
+
+    def resoudre(self, module, fonction, donnees, *dimensions, **options):
+        """Appelle module.fonction(donnees, *dimensions, **options) à travers le cache"""
+        donnees = list(donnees)
+        columnar = options.pop("columnar", False)
+        invariant = (module, fonction) in INVARIANTS
+        ordre = canonique(donnees) if invariant else range(len(donnees))
+        cle = empreinte(module, fonction, donnees, dimensions, options, ordre)
+
+        resultat = self._lire(cle)
+        if resultat is _ABSENT:
+            self.echecs += 1
+            solveur = getattr(charger_module(module), fonction)
+            resultat = solveur([donnees[i] for i in ordre], *dimensions, **options)
+            if isinstance(resultat, PlacementArray):
+                resultat = list(resultat)
+            self._ecrire(cle, resultat)
+        else:
+            self.succes += 1
+
+        resultat = _reidentifier(resultat, donnees, ordre) if invariant else copy.deepcopy(resultat)
+        return PlacementArray(resultat) if columnar else resultat
+
+    # ------------------------------------------------------------ stockage
+
+    def _chemin(self, cle):
+        return os.path.join(self.dossier, cle + ".pickle")
+
+    def _lire(self, cle):
+        if cle in self.memoire:
+            self.memoire.move_to_end(cle)
+            return self.memoire[cle]
+        if not self.dossier:
+            return _ABSENT
+        try:
+            with open(self._chemin(cle), "rb") as f:
+                resultat = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return _ABSENT
+        os.utime(self._chemin(cle))  # récemment utilisé
+        self._memoriser(cle, resultat)
+        return resultat
+
+    def _memoriser(self, cle, resultat):
+        self.memoire[cle] = resultat
+        self.memoire.move_to_end(cle)
+        while len(self.memoire) > self.capacite:
+            self.memoire.popitem(last=False)
+
+    def _ecrire(self, cle, resultat):
+        self._memoriser(cle, resultat)
+        if not self.dossier:
+            return
+        contenu = pickle.dumps(resultat, protocol=pickle.HIGHEST_PROTOCOL)
+        temporaire = self._chemin(cle) + ".tmp"
+        with open(temporaire, "wb") as f:
+            f.write(contenu)
+        os.replace(temporaire, self._chemin(cle))
+        self.taille_disque += len(contenu)
+        if self.taille_disque > self.taille_max_disque:
+            self._evincer()
+
+    def _evincer(self):
+        fichiers = sorted((e.stat().st_mtime, e.stat().st_size, e.path)
+                          for e in os.scandir(self.dossier) if e.name.endswith(".pickle"))
+        self.taille_disque = sum(taille for _, taille, _ in fichiers)
+        for _, taille, chemin in fichiers:
+            if self.taille_disque <= self.taille_max_disque:
+                break
+            os.remove(chemin)
+            self.taille_disque -= taille
+
+    def vider(self):
+        self.memoire.clear()
+        if self.dossier:
+            for e in os.scandir(self.dossier):
+                if e.name.endswith(".pickle"):
+                    os.remove(e.path)
+            self.taille_disque = 0
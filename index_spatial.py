@@ -0,0 +1,53 @@
+import math
+
+class IndexSpatial:
+    """Hachage spatial sur une grille uniforme de cases carrées.
+
+    Chaque objet est rangé dans toutes les cases que touche sa boîte
+    (x1, y1, x2, y2), fournie par l'appelant : elle doit contenir tout ce
+    que le test de collision exact peut considérer comme occupé. Une
+    requête ne renvoie que les objets des cases voisines ; le test exact
+    reste à faire sur ces candidats. Insertion et retrait sont en temps
+    constant (amorti) pour des objets de taille comparable à une case.
+    """
+
+    def __init__(self, taille_case=1.0):
+        self.taille_case = taille_case
+        self.cases = {}    # (i, j) -> {id(objet): objet}
+        self.objets = {}   # id(objet) -> (objet, cases occupées)
+
+    def __len__(self):
+        return len(self.objets)
+
+    def __iter__(self):
+        return (objet for objet, _ in self.objets.values())
+
+    def _cases(self, boite):
+        x1, y1, x2, y2 = boite
+        t = self.taille_case
+        return [(i, j)
+                for i in range(math.floor(x1 / t), math.floor(x2 / t) + 1)
+                for j in range(math.floor(y1 / t), math.floor(y2 / t) + 1)]
+
+    def inserer(self, objet, boite):
+        cases = self._cases(boite)
+        for case in cases:
+            self.cases.setdefault(case, {})[id(objet)] = objet
+        self.objets[id(objet)] = (objet, cases)
+
+    def retirer(self, objet):
+        _, cases = self.objets.pop(id(objet))
+        for case in cases:
+            contenu = self.cases[case]
+            del contenu[id(objet)]
+            if not contenu:
+                del self.cases[case]
+
+    def candidats(self, boite):
+        """Objets dont une case touche la boîte (chacun une seule fois)"""
+        vus = set()
+        for case in self._cases(boite):
+            for cle, objet in self.cases.get(case, {}).items():
+                if cle not in vus:
+                    vus.add(cle)
+                    yield objet
@@ -0,0 +1,154 @@
+"""Lecture en flux des fichiers d'instances (texte ou binaire), via mmap.
+
+Formats texte (comme exp1D.txt et exp2D.txt) : instances séparées par des
+lignes vides.
+    1D : tailles, une ou plusieurs par ligne ("5", "6 5 5 2 2")
+    2D : un rectangle par ligne ("Rect 1 : 9 , 9", "9 , 9" ou "9 9")
+Les blocs de résultats ("ff", "bac 1 : 5 2 2", ...) sont ignorés. Un bloc
+de nombres seuls est ambigu ("4 6" : deux tailles ou un rectangle) : sans
+dimension imposée par l'appelant, il est lu en 2D si chaque ligne a deux
+nombres.
+
+Format binaire : en-tête MAGIC puis, pour chaque instance, un en-tête de
+16 octets (dimension, typecode, 6 octets de bourrage, nombre d'objets sur
+8 octets) suivi des tailles (1D) ou des largeurs puis des hauteurs (2D),
+en entiers 64 bits ou en flottants, alignés sur 8 octets.
+
+Chaque instance est renvoyée à son tour par un générateur, sous forme de
+tableaux array : tailles en 1D, (largeurs, hauteurs) en 2D. Seule
+l'instance courante est en mémoire.
+"""
+import mmap
+import re
+import struct
+from array import array
+
+MAGIC = b"PACKINS1"
+_ENTETE = struct.Struct("<BB6xQ")
+
+_SEPARATEUR = re.compile(rb"\n[ \t\r]*\n")
+
+def _tableau(jetons):
+    try:
+        return array("q", map(int, jetons))
+    except ValueError:
+        return array("d", map(float, jetons))
+
+def _ouvrir(chemin):
+    with open(chemin, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def est_binaire(chemin):
+    with open(chemin, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def lire(chemin, dimension=None):
+    """Instances d'un fichier texte ou binaire : (dimension, données) où
+    données vaut tailles (dimension 1) ou (largeurs, hauteurs) (dimension 2).
+    Avec dimension (1 ou 2), une instance d'une autre dimension lève ValueError."""
+    return lire_binaire(chemin, dimension) if est_binaire(chemin) else lire_texte(chemin, dimension)
+
+def _verifier(instance, dimension, chemin):
+    if dimension is not None and instance[0] != dimension:
+        raise ValueError(f"{chemin} : instance en dimension {instance[0]}, {dimension} attendue")
+    return instance
+
+# ---------------------------------------------------------------- texte
+
+def _bloc(texte, dimension=None):
+    """Instance d'un bloc de texte, ou None pour un bloc vide ou de résultats"""
+    jetons = texte.split()
+    if not jetons:
+        return None
+    premier = jetons[0]
+    if premier.lower() != b"rect" and not premier[:1].isdigit() and premier[:1] not in b"-.":
+        return None  # "ff", "bac 1 : ...", ...
+
+    # Cas courant : des nombres seuls. Sans dimension imposée, c'est du 2D
+    # si chaque ligne en a deux.
+    if not any(c in texte for c in (b",", b":", b"R", b"r")):
+        if dimension == 1:
+            return 1, _tableau(jetons)
+        lignes = texte.strip().splitlines()
+        if len(jetons) != 2 * len(lignes) or any(len(l.split()) != 2 for l in lignes):
+            if dimension == 2:
+                raise ValueError("instance 2D attendue : deux nombres par ligne")
+            return 1, _tableau(jetons)
+        return 2, (_tableau(jetons[0::2]), _tableau(jetons[1::2]))
+
+    # "Rect 1 : w , h" ou "w , h"
+    valeurs = []
+    for ligne in texte.splitlines():
+        l = ligne.replace(b",", b" ").replace(b":", b" ").split()
+        if l and l[0].lower() == b"rect":
+            l = l[2:]
+        valeurs += l[:2]
+    return 2, (_tableau(valeurs[0::2]), _tableau(valeurs[1::2]))
+
+def lire_texte(chemin, dimension=None):
+    mm = _ouvrir(chemin)
+    if mm is None:
+        return
+    with mm:
+        debut = 0
+        for separateur in _SEPARATEUR.finditer(mm):
+            instance = _bloc(mm[debut:separateur.start()], dimension)
+            debut = separateur.end()
+            if instance is not None:
+                yield _verifier(instance, dimension, chemin)
+        instance = _bloc(mm[debut:], dimension)
+        if instance is not None:
+            yield _verifier(instance, dimension, chemin)
+
+# ---------------------------------------------------------------- binaire
+
+def ecrire_binaire(chemin, instances):
+    """Écrit des instances : listes de tailles (1D) ou de (w, h) (2D)"""
+    nb = 0
+    with open(chemin, "wb") as f:
+        f.write(MAGIC)
+        for instance in instances:
+            instance = list(instance)
+            if instance and isinstance(instance[0], (tuple, list)):
+                colonnes = [[w for w, _ in instance], [h for _, h in instance]]
+            else:
+                colonnes = [instance]
+            flottant = any(isinstance(v, float) for c in colonnes for v in c)
+            typecode = "d" if flottant else "q"
+            f.write(_ENTETE.pack(len(colonnes), ord(typecode), len(instance)))
+            for c in colonnes:
+                tableau = array(typecode, c)
+                if tableau.itemsize != 8:
+                    raise ValueError("entiers 64 bits non disponibles")
+                f.write(tableau.tobytes())
+            nb += 1
+    return nb
+
+def lire_binaire(chemin, dimension=None):
+    mm = _ouvrir(chemin)
+    if mm is None:
+        return
+    with mm:
+        if mm[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{chemin} : fichier d'instances binaire invalide")
+        position = len(MAGIC)
+        while position < len(mm):
+            nb_colonnes, typecode, n = _ENTETE.unpack_from(mm, position)
+            position += _ENTETE.size
+            colonnes = []
+            for _ in range(nb_colonnes):
+                tableau = array(chr(typecode))
+                tableau.frombytes(mm[position:position + 8 * n])
+                colonnes.append(tableau)
+                position += 8 * n
+            instance = (1, colonnes[0]) if len(colonnes) == 1 else (2, tuple(colonnes))
+            yield _verifier(instance, dimension, chemin)
+
+def convertir(source, destination, dimension=None):
+    """Recopie un fichier d'instances texte au format binaire"""
+    def instances():
+        for dimension_lue, donnees in lire_texte(source, dimension):
+            yield list(donnees) if dimension_lue == 1 else list(zip(*donnees))
+    return ecrire_binaire(destination, instances())
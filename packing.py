@@ -0,0 +1,228 @@
+"""Solveurs sans interface graphique et lanceur en ligne de commande.
+
+Exemples :
+    python packing.py instance.json --algo ffd --format csv
+    python packing.py rectangles.txt --algo ffdh --largeur 10 --hauteur 30 --sortie res.json
+
+tkinter n'est chargé que si --dessiner est demandé ; --image écrit un SVG ou
+un PNG sans interface graphique.
+"""
+import argparse
+import csv
+import importlib
+import io
+import itertools
+import json
+import sys
+
+import instances
+
+# famille -> nom court -> (module, fonction)
+ALGORITHMES = {
+    "1d": {
+        "ff": ("1D", "first_fit"),
+        "bf": ("1D", "best_fit"),
+        "wf": ("1D", "worst_fit"),
+        "ffd": ("1D", "first_fit_decreasing"),
+        "bfd": ("1D", "best_fit_decreasing"),
+        "wfd": ("1D", "worst_fit_decreasing"),
+        "exact": ("1D_fb", "bin_packing_all_combinations"),
+        "dp": ("1D_fb", "bin_packing_dp"),
+    },
+    "2d": {
+        "nfdh": ("2D", "NFDH"),
+        "ffdh": ("2D", "FFDH"),
+        "bfdh": ("2D", "BFDH"),
+        "skyline": ("2D", "Skyline"),
+        "maxrects": ("2D", "MaxRects"),
+        "multi": ("2D", "FFDH_multi"),
+        "exact": ("2D", "brute_force_packing_2d"),
+    },
+    "formes": {
+        "nfdh": ("2DPackingMultiForm", "NFDH"),
+        "ffdh": ("2DPackingMultiForm", "FFDH"),
+        "bestfit": ("2DPackingMultiForm", "BestFit"),
+        "exact": ("2DPackingBruteForce", "brute_force_packing"),
+    },
+}
+
+def charger_module(nom):
+    """Importe un module du dépôt par son nom de fichier (ex. "1D_fb")"""
+    return importlib.import_module(nom)
+
+def solveur(famille, algo):
+    module, fonction = ALGORITHMES[famille][algo]
+    return getattr(charger_module(module), fonction)
+
+def lire_instance(chemin, capacite=None, largeur=None, hauteur=None, numero=1):
+    """Lit une instance JSON, texte ou binaire et renvoie (famille, instance).
+
+    JSON : {"objets": [...], "capacite": C}, {"rectangles": [[w, h], ...],
+    "largeur": W, "hauteur": H} ou {"formes": [{"type", "dimension"}, ...], ...}.
+    Texte et binaire : formats de instances.py (exp1D.txt, exp2D.txt, ...) ;
+    numero choisit l'instance du fichier (à partir de 1). Une capacité seule
+    impose la lecture en 1D, une largeur ou une hauteur seule en 2D.
+    Les options de la ligne de commande remplacent les valeurs du fichier.
+    """
+    with open(chemin, "rb") as f:
+        debut = f.read(64).lstrip()
+
+    if debut.startswith(b"{"):
+        with open(chemin, encoding="utf-8") as f:
+            donnees = json.load(f)
+    else:
+        dimension = None
+        if capacite is not None and largeur is None and hauteur is None:
+            dimension = 1
+        elif capacite is None and (largeur is not None or hauteur is not None):
+            dimension = 2
+        instance = next(itertools.islice(instances.lire(chemin, dimension), numero - 1, None), None)
+        if instance is None:
+            raise ValueError(f"{chemin} : pas d'instance numéro {numero}")
+        dimension, valeurs = instance
+        if dimension == 1:
+            donnees = {"objets": valeurs.tolist()}
+        else:
+            donnees = {"rectangles": list(zip(*(v.tolist() for v in valeurs)))}
+
+    if "objets" in donnees:
+        instance = {"objets": donnees["objets"], "capacite": capacite or donnees.get("capacite")}
+        if instance["capacite"] is None:
+            raise ValueError("Capacité des bacs manquante (--capacite)")
+        return "1d", instance
+
+    if "rectangles" in donnees:
+        famille, instance = "2d", {"rectangles": [tuple(r) for r in donnees["rectangles"]]}
+    else:
+        famille = "formes"
+        instance = {"formes": [dict(f, dimension=tuple(f["dimension"])) for f in donnees["formes"]]}
+    instance["largeur"] = largeur or donnees.get("largeur")
+    instance["hauteur"] = hauteur or donnees.get("hauteur")
+    if instance["largeur"] is None or instance["hauteur"] is None:
+        raise ValueError("Dimensions du conteneur manquantes (--largeur, --hauteur)")
+    return famille, instance
+
+def _nombre(texte):
+    valeur = float(texte)
+    return int(valeur) if valeur.is_integer() else valeur
+
+def resoudre(famille, algo, instance):
+    """Lance l'algorithme et renvoie un résultat sérialisable en JSON"""
+    fonction = solveur(famille, algo)
+    if famille == "1d":
+        objets, capacite = instance["objets"], instance["capacite"]
+        resultat = fonction(objets, capacite)
+        if isinstance(resultat[0], int):
+            placements = _identifier(objets, resultat[1])
+        else:
+            placements = resultat[1]
+        return {
+            "algorithme": algo,
+            "capacite": capacite,
+            "nb_bacs": max((bac for _, _, bac in placements), default=0),
+            "placements": [{"id": i, "taille": t, "bac": b} for i, t, b in placements],
+        }
+
+    donnees = instance["rectangles"] if famille == "2d" else instance["formes"]
+    placements = fonction(donnees, instance["largeur"], instance["hauteur"]) or []
+    return {
+        "algorithme": algo,
+        "largeur": instance["largeur"],
+        "hauteur": instance["hauteur"],
+        "placements": list(placements),
+    }
+
+def _identifier(objets, bacs):
+    # Les solveurs exacts renvoient des tailles : on retrouve les objets d'origine
+    libres = {}
+    for i, obj in enumerate(objets):
+        libres.setdefault(obj, []).append(i + 1)
+    for indices in libres.values():
+        indices.reverse()
+    placements = [(libres[t].pop(), t, b) for b, bac in enumerate(bacs, 1) for t in bac]
+    placements.sort()
+    return placements
+
+def vers_csv(famille, resultat):
+    sortie = io.StringIO()
+    ecrivain = csv.writer(sortie)
+    if famille == "1d":
+        ecrivain.writerow(["id", "taille", "bac"])
+        for p in resultat["placements"]:
+            ecrivain.writerow([p["id"], p["taille"], p["bac"]])
+    else:
+        # plusieurs plaques : une colonne de plus pour le numéro de plaque
+        plaques = any("bac" in p for p in resultat["placements"])
+        ecrivain.writerow(["id", "type", "x", "y", "dimension", "rotation"] + ["bac"] * plaques)
+        for p in resultat["placements"]:
+            x, y = p["position"]
+            dimension = " ".join(str(v) for v in p["dimension"])
+            ecrivain.writerow([p["id"], p.get("type", "rectangle"), x, y, dimension,
+                               p.get("rotation", 0)] + [p.get("bac")] * plaques)
+    return sortie.getvalue()
+
+def dessiner(famille, instance, resultat, algo):
+    if famille == "1d":
+        import tkinter as tk
+
+        module = charger_module("1D")
+        bins = [[] for _ in range(resultat["nb_bacs"])]
+        for p in resultat["placements"]:
+            bins[p["bac"] - 1].append((p["id"], p["taille"]))
+        placements = [(p["id"], p["taille"], p["bac"]) for p in resultat["placements"]]
+
+        root = tk.Tk()
+        app = module.PackingApp(root)
+        app.objects = list(instance["objets"])
+        app.bin_capacity.set(instance["capacite"])
+        app.update_affichage_objets()
+        app.afficher_resultats(bins, placements, instance["capacite"])
+        root.mainloop()
+    else:
+        module = charger_module(ALGORITHMES[famille][algo][0])
+        module.dessiner_interface(instance["largeur"], instance["hauteur"], resultat["placements"])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bin packing 1D / 2D sans interface graphique")
+    parser.add_argument("instance", help="fichier d'instance (JSON, texte ou binaire)")
+    parser.add_argument("--numero", type=int, default=1, help="numéro de l'instance dans le fichier")
+    parser.add_argument("--algo", default=None, help="algorithme (défaut : ff en 1D, ffdh en 2D)")
+    parser.add_argument("--capacite", type=_nombre, help="capacité d'un bac (1D)")
+    parser.add_argument("--largeur", type=_nombre, help="largeur du conteneur (2D)")
+    parser.add_argument("--hauteur", type=_nombre, help="hauteur du conteneur (2D)")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--sortie", help="fichier de sortie (défaut : sortie standard)")
+    parser.add_argument("--dessiner", action="store_true", help="afficher le résultat avec tkinter")
+    parser.add_argument("--image", help="écrire le placement 2D en .svg ou .png (sans tkinter)")
+    args = parser.parse_args(argv)
+
+    try:
+        famille, instance = lire_instance(args.instance, args.capacite, args.largeur, args.hauteur,
+                                          args.numero)
+    except ValueError as erreur:
+        parser.error(str(erreur))
+    algo = args.algo or ("ff" if famille == "1d" else "ffdh")
+    if algo not in ALGORITHMES[famille]:
+        parser.error(f"algorithme inconnu pour une instance {famille} : {algo} "
+                     f"(choix : {', '.join(ALGORITHMES[famille])})")
+
+    resultat = resoudre(famille, algo, instance)
+    texte = vers_csv(famille, resultat) if args.format == "csv" else json.dumps(resultat, ensure_ascii=False)
+
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8", newline="") as f:
+            f.write(texte)
+    else:
+        sys.stdout.write(texte + ("" if texte.endswith("\n") else "\n"))
+
+    if args.image:
+        if famille == "1d":
+            parser.error("--image n'est disponible que pour les placements 2D")
+        charger_module("rendu").enregistrer(args.image, instance["largeur"], instance["hauteur"],
+                                            resultat["placements"])
+
+    if args.dessiner:
+        dessiner(famille, instance, resultat, algo)
+
+if __name__ == "__main__":
+    main()
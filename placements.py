@@ -0,0 +1,147 @@
+import math
+import sys
+from array import array
+
+TYPES = ["rectangle", "triangle", "cercle"]
+
+# clés optionnelles des dictionnaires, une par bit du masque de chaque placement
+CLES = ["type", "rotation", "width", "bac"]
+
+# typecode des colonnes -> descripteur numpy
+_DESCR = {"i": "i4", "q": "i8", "d": "f8", "b": "i1"}
+
+QUART = math.pi / 2
+
+class PlacementArray:
+    """Placements 2D stockés en colonnes typées plutôt qu'en dictionnaires.
+
+    Colonnes : id, x, y, w, h, rotation, type (indice dans TYPES) et bac.
+    Un placement se lit comme avant (p[i] renvoie le dictionnaire habituel)
+    et chaque colonne s'exporte sans copie (memoryview, numpy, .npy).
+    Les entiers sont d'abord sur 32 bits, puis 64 bits, puis passent en
+    flottants dès qu'une valeur l'est : les valeurs entières restent alors
+    marquées comme telles et se relisent en int. La rotation est stockée en
+    quarts de tour tant qu'elle est un multiple de pi/2. Les clés
+    optionnelles (CLES) présentes sont retenues pour chaque placement.
+    """
+
+    def __init__(self, placements=()):
+        self.colonnes = {nom: array("i") for nom in ("id", "x", "y", "w", "h", "bac")}
+        self.colonnes["rotation"] = array("b")
+        self.colonnes["type"] = array("b")
+        self.cles = array("b")  # masque des clés optionnelles de chaque placement
+        self.flottants = {}  # colonne passée en flottants -> 1 si la valeur était un float
+        for placement in placements:
+            self.append(placement)
+
+    def __len__(self):
+        return len(self.colonnes["id"])
+
+    def _ajouter(self, nom, valeur):
+        colonne = self.colonnes[nom]
+        if colonne.typecode != "d":
+            if isinstance(valeur, float):
+                colonne = self.colonnes[nom] = array("d", colonne)
+                self.flottants[nom] = array("b", bytes(len(colonne)))
+            elif colonne.typecode == "i" and not -2**31 <= valeur < 2**31:
+                colonne = self.colonnes[nom] = array("q", colonne)
+        if nom in self.flottants:
+            self.flottants[nom].append(isinstance(valeur, float))
+        colonne.append(valeur)
+
+    def _valeur(self, nom, i):
+        valeur = self.colonnes[nom][i]
+        if nom in self.flottants and not self.flottants[nom][i]:
+            return int(valeur)
+        return valeur
+
+    def _ajouter_rotation(self, rotation):
+        colonne = self.colonnes["rotation"]
+        if colonne.typecode == "b":
+            quarts = round(rotation / QUART)
+            if quarts * QUART == rotation:
+                colonne.append(quarts)
+                return
+            colonne = self.colonnes["rotation"] = array("d", (q * QUART for q in colonne))
+        colonne.append(rotation)
+
+    def _rotation(self, i):
+        colonne = self.colonnes["rotation"]
+        if colonne.typecode == "d":
+            return colonne[i] or 0
+        return colonne[i] * QUART if colonne[i] else 0
+
+    def append(self, placement):
+        self.cles.append(sum(1 << k for k, cle in enumerate(CLES) if cle in placement))
+        x, y = placement["position"]
+        dimension = placement["dimension"]
+        w, h = (dimension[0], dimension[0]) if len(dimension) == 1 else dimension
+        self._ajouter("id", placement["id"])
+        self._ajouter("x", x)
+        self._ajouter("y", y)
+        self._ajouter("w", w)
+        self._ajouter("h", h)
+        self._ajouter("bac", placement.get("bac", 0))
+        self._ajouter_rotation(placement.get("rotation", 0))
+        self.colonnes["type"].append(TYPES.index(placement.get("type", "rectangle")))
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("indice de placement hors limites")
+        cles = [cle for k, cle in enumerate(CLES) if self.cles[i] >> k & 1]
+        type_forme = TYPES[self.colonnes["type"][i]]
+        w, h = self._valeur("w", i), self._valeur("h", i)
+        placement = {"id": self._valeur("id", i)}
+        if "type" in cles:
+            placement["type"] = type_forme
+        placement["position"] = (self._valeur("x", i), self._valeur("y", i))
+        placement["dimension"] = (w,) if type_forme == "cercle" else (w, h)
+        if "rotation" in cles:
+            placement["rotation"] = self._rotation(i)
+        if "width" in cles:
+            # dimensions après rotation, comme dans BestFit
+            tourne = type_forme != "cercle" and self._rotation(i) in (math.pi/2, 3*math.pi/2)
+            placement["width"], placement["height"] = (h, w) if tourne else (w, h)
+        if "bac" in cles:
+            placement["bac"] = self._valeur("bac", i)
+        return placement
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return f"PlacementArray({len(self)} placements)"
+
+    @property
+    def nbytes(self):
+        return sum(len(c) * c.itemsize
+                   for c in [*self.colonnes.values(), self.cles, *self.flottants.values()])
+
+    def colonne(self, nom):
+        """Vue sans copie sur une colonne (protocole buffer)"""
+        return memoryview(self.colonnes[nom])
+
+    def to_numpy(self):
+        """Colonnes sous forme de tableaux numpy partageant la mémoire"""
+        import numpy as np
+
+        return {nom: np.frombuffer(c, dtype=_DESCR[c.typecode]) for nom, c in self.colonnes.items()}
+
+    def sauver_npy(self, prefixe):
+        """Écrit chaque colonne dans prefixe_<nom>.npy, directement depuis le buffer"""
+        ordre = "<" if sys.byteorder == "little" else ">"
+        for nom, c in self.colonnes.items():
+            entete = "{'descr': '%s%s', 'fortran_order': False, 'shape': (%d,), }" % (
+                ordre if c.itemsize > 1 else "|", _DESCR[c.typecode], len(c))
+            # l'en-tête complet (10 octets + texte + \n) est aligné sur 64 octets
+            entete += " " * (63 - (10 + len(entete)) % 64) + "\n"
+            with open(f"{prefixe}_{nom}.npy", "wb") as f:
+                f.write(b"\x93NUMPY\x01\x00")
+                f.write(len(entete).to_bytes(2, "little"))
+                f.write(entete.encode("latin1"))
+                f.write(memoryview(c))
@@ -0,0 +1,208 @@
+"""Rendu hors écran des placements 2D en SVG ou PNG, sans tkinter.
+
+Accepte les placements des trois modules 2D (2D.py, 2DPackingMultiForm.py,
+2DPackingBruteForce.py) avec les mêmes conventions que leurs
+dessiner_interface : position = coin haut-gauche du rectangle englobant,
+triangles orientés selon la rotation, cercles inscrits dans leur carré.
+Les placements sur plusieurs plaques (clé "bac" de 2D.FFDH_multi) sont
+dessinés côte à côte, un cadre W x H par plaque.
+
+Exemples :
+    enregistrer("plan.svg", W, H, placements)
+    rendre_lot([("a.png", W, H, p1), ("b.png", W, H, p2)])
+"""
+import math
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+COULEURS = {"rectangle": "skyblue", "triangle": "lightgreen", "cercle": "salmon"}
+RGB = {"skyblue": (135, 206, 235), "lightgreen": (144, 238, 144), "salmon": (250, 128, 114),
+       "black": (0, 0, 0), "white": (255, 255, 255)}
+
+def geometrie(placement):
+    """(type, x, y, largeur, hauteur, rotation) du rectangle englobant"""
+    type_forme = placement.get("type", "rectangle")
+    rotation = placement.get("rotation", 0)
+    x, y = placement["position"]
+    if "width" in placement:
+        w, h = placement["width"], placement["height"]
+    elif type_forme == "cercle":
+        w = h = placement["dimension"][0]
+    else:
+        w, h = placement["dimension"]
+        if rotation in (math.pi/2, 3*math.pi/2):
+            w, h = h, w
+    return type_forme, x, y, w, h, rotation
+
+def sommets_triangle(x1, y1, x2, y2, rotation):
+    if rotation == math.pi/2:
+        return [(x1, y1), (x2, (y1 + y2) / 2), (x1, y2)]
+    if rotation == math.pi:
+        return [((x1 + x2) / 2, y2), (x1, y1), (x2, y1)]
+    if rotation == 3*math.pi/2:
+        return [(x2, y1), (x1, (y1 + y2) / 2), (x2, y2)]
+    return [(x1, y2), ((x1 + x2) / 2, y1), (x2, y2)]
+
+def feuilles(placements):
+    """Placements groupés par plaque, dans l'ordre des numéros ("bac").
+
+    Sans clé "bac", tout est sur une seule plaque.
+    """
+    groupes = {}
+    for placement in placements:
+        groupes.setdefault(placement.get("bac", 1), []).append(placement)
+    return [groupe for _, groupe in sorted(groupes.items())] or [[]]
+
+def _cadres(W, nb, scale, padding):
+    # abscisse (en pixels) du cadre de chaque plaque, plaques côte à côte
+    return [padding + k * (W * scale + padding) for k in range(nb)]
+
+# ---------------------------------------------------------------- SVG
+
+def vers_svg(W, H, placements, scale=40, padding=10):
+    plaques = feuilles(placements)
+    cadres = _cadres(W, len(plaques), scale, padding)
+    largeur, hauteur = len(plaques) * (W * scale + padding) + padding, H * scale + 2 * padding
+    lignes = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{largeur:g}" height="{hauteur:g}" '
+        f'viewBox="0 0 {largeur:g} {hauteur:g}">',
+        '<rect width="100%" height="100%" fill="white"/>',
+    ]
+    for gauche in cadres:
+        lignes.append(f'<rect x="{gauche:g}" y="{padding}" width="{W * scale:g}" height="{H * scale:g}" '
+                      f'fill="none" stroke="black" stroke-width="3"/>')
+    for gauche, placement in ((g, p) for g, plaque in zip(cadres, plaques) for p in plaque):
+        type_forme, x, y, w, h, rotation = geometrie(placement)
+        x1, y1 = gauche + x * scale, padding + y * scale
+        x2, y2 = x1 + w * scale, y1 + h * scale
+        couleur = COULEURS.get(type_forme, "skyblue")
+        if type_forme == "cercle":
+            r = w * scale / 2
+            lignes.append(f'<circle cx="{x1 + r:g}" cy="{y1 + r:g}" r="{r:g}" '
+                          f'fill="{couleur}" stroke="black"/>')
+        elif type_forme == "triangle":
+            points = " ".join(f"{px:g},{py:g}" for px, py in sommets_triangle(x1, y1, x2, y2, rotation))
+            lignes.append(f'<polygon points="{points}" fill="{couleur}" stroke="black"/>')
+        else:
+            lignes.append(f'<rect x="{x1:g}" y="{y1:g}" width="{x2 - x1:g}" height="{y2 - y1:g}" '
+                          f'fill="{couleur}" stroke="black"/>')
+        lignes.append(f'<text x="{(x1 + x2) / 2:g}" y="{(y1 + y2) / 2:g}" font-family="Arial" '
+                      f'font-size="12" font-weight="bold" text-anchor="middle" '
+                      f'dominant-baseline="central">{placement["id"]}</text>')
+    lignes.append("</svg>")
+    return "\n".join(lignes) + "\n"
+
+# ---------------------------------------------------------------- PNG
+
+class _Image:
+    """Image RGB en mémoire, remplie ligne par ligne"""
+
+    def __init__(self, largeur, hauteur, fond):
+        self.largeur, self.hauteur = largeur, hauteur
+        self.pixels = bytearray(bytes(fond) * (largeur * hauteur))
+
+    def segment(self, y, xa, xb, couleur):
+        # pixels dont le centre est dans [xa, xb) sur la ligne y
+        if not 0 <= y < self.hauteur:
+            return
+        debut = max(0, math.ceil(xa - 0.5))
+        fin = min(self.largeur, math.ceil(xb - 0.5))
+        if fin > debut:
+            i = (y * self.largeur + debut) * 3
+            self.pixels[i:i + 3 * (fin - debut)] = bytes(couleur) * (fin - debut)
+
+    def rectangle(self, x1, y1, x2, y2, couleur):
+        for y in range(max(0, math.ceil(y1 - 0.5)), min(self.hauteur, math.ceil(y2 - 0.5))):
+            self.segment(y, x1, x2, couleur)
+
+    def polygone(self, sommets, couleur):
+        ys = [py for _, py in sommets]
+        for y in range(max(0, math.ceil(min(ys) - 0.5)), min(self.hauteur, math.ceil(max(ys) - 0.5))):
+            centre = y + 0.5
+            xs = []
+            for (xa, ya), (xb, yb) in zip(sommets, sommets[1:] + sommets[:1]):
+                if (ya <= centre < yb) or (yb <= centre < ya):
+                    xs.append(xa + (centre - ya) * (xb - xa) / (yb - ya))
+            if len(xs) >= 2:
+                self.segment(y, min(xs), max(xs), couleur)
+
+    def disque(self, cx, cy, r, couleur):
+        for y in range(max(0, math.ceil(cy - r - 0.5)), min(self.hauteur, math.ceil(cy + r - 0.5))):
+            dy = y + 0.5 - cy
+            if abs(dy) < r:
+                dx = math.sqrt(r * r - dy * dy)
+                self.segment(y, cx - dx, cx + dx, couleur)
+
+    def png(self):
+        ligne = 3 * self.largeur
+        brut = b"".join(b"\x00" + self.pixels[i:i + ligne] for i in range(0, len(self.pixels), ligne))
+
+        def bloc(nom, donnees):
+            return (struct.pack(">I", len(donnees)) + nom + donnees
+                    + struct.pack(">I", zlib.crc32(nom + donnees) & 0xFFFFFFFF))
+
+        return (b"\x89PNG\r\n\x1a\n"
+                + bloc(b"IHDR", struct.pack(">IIBBBBB", self.largeur, self.hauteur, 8, 2, 0, 0, 0))
+                + bloc(b"IDAT", zlib.compress(bytes(brut), 6))
+                + bloc(b"IEND", b""))
+
+def vers_png(W, H, placements, scale=40, padding=10):
+    """Image PNG (octets) ; les formes ont un contour noir d'un pixel, sans texte"""
+    plaques = feuilles(placements)
+    cadres = _cadres(W, len(plaques), scale, padding)
+    image = _Image(round(len(plaques) * (W * scale + padding) + padding), round(H * scale + 2 * padding),
+                   RGB["white"])
+    noir = RGB["black"]
+    for gauche in cadres:
+        image.rectangle(gauche - 2, padding - 2, gauche + W * scale + 2, padding + H * scale + 2, noir)
+        image.rectangle(gauche + 1, padding + 1, gauche + W * scale - 1, padding + H * scale - 1, RGB["white"])
+
+    for gauche, placement in ((g, p) for g, plaque in zip(cadres, plaques) for p in plaque):
+        type_forme, x, y, w, h, rotation = geometrie(placement)
+        x1, y1 = gauche + x * scale, padding + y * scale
+        x2, y2 = x1 + w * scale, y1 + h * scale
+        couleur = RGB[COULEURS.get(type_forme, "skyblue")]
+        if type_forme == "cercle":
+            r = w * scale / 2
+            image.disque(x1 + r, y1 + r, r, noir)
+            image.disque(x1 + r, y1 + r, r - 1, couleur)
+        elif type_forme == "triangle":
+            sommets = sommets_triangle(x1, y1, x2, y2, rotation)
+            image.polygone(sommets, noir)
+            # triangle intérieur : sommets rapprochés du centre de gravité d'un pixel
+            gx = sum(px for px, _ in sommets) / 3
+            gy = sum(py for _, py in sommets) / 3
+            interieur = []
+            for px, py in sommets:
+                d = math.hypot(px - gx, py - gy) or 1
+                k = max(0, 1 - 2 / d)
+                interieur.append((gx + (px - gx) * k, gy + (py - gy) * k))
+            image.polygone(interieur, couleur)
+        else:
+            image.rectangle(x1, y1, x2, y2, noir)
+            image.rectangle(x1 + 1, y1 + 1, x2 - 1, y2 - 1, couleur)
+    return image.png()
+
+# ---------------------------------------------------------------- fichiers
+
+def enregistrer(chemin, W, H, placements, scale=40, padding=10):
+    """Écrit le placement en SVG ou en PNG selon l'extension du fichier"""
+    if chemin.lower().endswith(".png"):
+        with open(chemin, "wb") as f:
+            f.write(vers_png(W, H, placements, scale, padding))
+    else:
+        with open(chemin, "w", encoding="utf-8") as f:
+            f.write(vers_svg(W, H, placements, scale, padding))
+    return chemin
+
+def _enregistrer_travail(travail):
+    return enregistrer(*travail)
+
+def rendre_lot(travaux, processus=None, chunksize=16):
+    """Rend une liste de (chemin, W, H, placements[, scale, padding]) en parallèle"""
+    travaux = list(travaux)
+    if processus == 1 or len(travaux) <= 1:
+        return [_enregistrer_travail(t) for t in travaux]
+    with ProcessPoolExecutor(max_workers=processus) as executeur:
+        return list(executeur.map(_enregistrer_travail, travaux, chunksize=chunksize))
@@ -0,0 +1,105 @@
+from bisect import bisect_left, insort
+
+class MaxSegmentTree:
+    """Arbre de segments (tournoi) sur des valeurs numériques.
+
+    Chaque noeud interne garde le maximum de ses deux fils, ce qui permet de
+    trouver en O(log n) la première feuille dont la valeur atteint un seuil.
+    """
+
+    def __init__(self, values):
+        self.n = len(values)
+        self.size = 1
+        while self.size < max(self.n, 1):
+            self.size *= 2
+        self.tree = [float("-inf")] * (2 * self.size)
+        self.tree[self.size:self.size + self.n] = values
+        for i in range(self.size - 1, 0, -1):
+            self.tree[i] = max(self.tree[2 * i], self.tree[2 * i + 1])
+
+    def __getitem__(self, i):
+        return self.tree[self.size + i]
+
+    def update(self, i, value):
+        tree = self.tree
+        i += self.size
+        tree[i] = value
+        i //= 2
+        while i:
+            best = tree[2 * i] if tree[2 * i] >= tree[2 * i + 1] else tree[2 * i + 1]
+            if tree[i] == best:
+                break  # les ancêtres sont déjà à jour
+            tree[i] = best
+            i //= 2
+
+    def first_at_least(self, x):
+        """Indice de la première feuille de valeur >= x, ou -1"""
+        tree, size = self.tree, self.size
+        if self.n == 0 or tree[1] < x:
+            return -1
+        i = 1
+        while i < size:
+            i = 2 * i if tree[2 * i] >= x else 2 * i + 1
+        return i - size
+
+    def append(self, value):
+        """Ajoute une feuille en fin d'arbre (la taille double au besoin)"""
+        if self.n == self.size:
+            self.__init__(self.tree[self.size:self.size + self.n] + [value])
+        else:
+            self.n += 1
+            self.update(self.n - 1, value)
+
+class ListeTriee:
+    """Liste triée découpée en blocs de taille bornée.
+
+    Un index des derniers éléments de chaque bloc permet de trouver le bon
+    bloc par dichotomie : insérer ou retirer ne décale qu'un bloc, au lieu
+    de toute la liste comme avec bisect.insort sur une seule liste.
+    """
+
+    CHARGE = 512
+
+    def __init__(self):
+        self.blocs = []
+        self.derniers = []  # dernier élément de chaque bloc (liste croissante)
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        for bloc in self.blocs:
+            yield from bloc
+
+    def ajouter(self, x):
+        self.n += 1
+        if not self.blocs:
+            self.blocs.append([x])
+            self.derniers.append(x)
+            return
+        b = bisect_left(self.derniers, x)
+        if b == len(self.blocs):
+            b -= 1
+            self.blocs[b].append(x)
+            self.derniers[b] = x
+        else:
+            insort(self.blocs[b], x)
+        bloc = self.blocs[b]
+        if len(bloc) > 2 * self.CHARGE:
+            self.blocs[b:b + 1] = [bloc[:self.CHARGE], bloc[self.CHARGE:]]
+            self.derniers[b:b + 1] = [bloc[self.CHARGE - 1], bloc[-1]]
+
+    def extraire_au_moins(self, x):
+        """Retire et renvoie le plus petit élément >= x, ou None"""
+        b = bisect_left(self.derniers, x)
+        if b == len(self.blocs):
+            return None
+        bloc = self.blocs[b]
+        valeur = bloc.pop(bisect_left(bloc, x))
+        self.n -= 1
+        if not bloc:
+            del self.blocs[b], self.derniers[b]
+        else:
+            self.derniers[b] = bloc[-1]
+        return valeur
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Les modules sont des scripts à la racine (certains commencent par un chiffre)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,177 @@
+import importlib
+import random
+
+import pytest
+
+un_d = importlib.import_module("1D")
+
+# Versions d'origine, par balayage de tous les bacs ouverts
+def first_fit_balayage(objects, bin_capacity):
+    bins = []
+    placements = []
+    for i, obj in enumerate(objects):
+        for j in range(len(bins)):
+            if sum(item[1] for item in bins[j]) + obj <= bin_capacity:
+                bins[j].append((i + 1, obj))
+                placements.append((i + 1, obj, j + 1))
+                break
+        else:
+            bins.append([(i + 1, obj)])
+            placements.append((i + 1, obj, len(bins)))
+    return bins, placements
+
+def best_fit_balayage(objects, bin_capacity):
+    bins = []
+    placements = []
+    for i, obj in enumerate(objects):
+        best_index = -1
+        min_space_left = bin_capacity + 1
+        for j, bin in enumerate(bins):
+            space_left = bin_capacity - sum(item[1] for item in bin)
+            if obj <= space_left and space_left < min_space_left:
+                best_index = j
+                min_space_left = space_left
+        if best_index != -1:
+            bins[best_index].append((i + 1, obj))
+            placements.append((i + 1, obj, best_index + 1))
+        else:
+            bins.append([(i + 1, obj)])
+            placements.append((i + 1, obj, len(bins)))
+    return bins, placements
+
+def worst_fit_balayage(objects, bin_capacity):
+    bins = []
+    placements = []
+    for i, obj in enumerate(objects):
+        worst_index = -1
+        max_space_left = -1
+        for j, bin in enumerate(bins):
+            space_left = bin_capacity - sum(item[1] for item in bin)
+            if obj <= space_left and space_left > max_space_left:
+                worst_index = j
+                max_space_left = space_left
+        if worst_index != -1:
+            bins[worst_index].append((i + 1, obj))
+            placements.append((i + 1, obj, worst_index + 1))
+        else:
+            bins.append([(i + 1, obj)])
+            placements.append((i + 1, obj, len(bins)))
+    return bins, placements
+
+EN_LIGNE = [
+    (un_d.first_fit, first_fit_balayage),
+    (un_d.best_fit, best_fit_balayage),
+    (un_d.worst_fit, worst_fit_balayage),
+]
+
+def _instance(graine):
+    rng = random.Random(graine)
+    capacite = rng.choice([10, 20, 100])
+    return [rng.randint(1, capacite) for _ in range(rng.randint(0, 80))], capacite
+
+@pytest.mark.parametrize("graine", range(20))
+@pytest.mark.parametrize("heuristique, reference", EN_LIGNE)
+def test_en_ligne_egale_balayage(heuristique, reference, graine):
+    objets, capacite = _instance(graine)
+    assert heuristique(objets, capacite) == reference(objets, capacite)
+
+@pytest.mark.parametrize("heuristique, reference", EN_LIGNE)
+def test_objet_plus_grand_qu_un_bac(heuristique, reference):
+    assert heuristique([12, 3, 11], 10) == reference([12, 3, 11], 10)
+
+@pytest.mark.parametrize("heuristique, reference", EN_LIGNE)
+def test_en_ligne_accepte_un_generateur(heuristique, reference):
+    objets, capacite = _instance(3)
+    assert heuristique(iter(objets), capacite) == reference(objets, capacite)
+
+def test_best_fit_oublie_les_bacs_pleins():
+    # bacs pleins ou trop petits pour le plus petit objet : hors de l'index
+    objets = [7, 3, 8, 2, 6, 2]
+    assert un_d.best_fit(objets, 10) == best_fit_balayage(objets, 10)
+    assert un_d.best_fit([3, 3, 3, 3], 10) == best_fit_balayage([3, 3, 3, 3], 10)
+
+DECROISSANTS = [
+    (un_d.first_fit_decreasing, first_fit_balayage),
+    (un_d.best_fit_decreasing, best_fit_balayage),
+    (un_d.worst_fit_decreasing, worst_fit_balayage),
+]
+
+def _decroissant(reference, objets, capacite):
+    # Balayage d'origine sur les objets triés (tri stable), indices d'origine rétablis
+    ordre = sorted(range(len(objets)), key=lambda i: objets[i], reverse=True)
+    bins, placements = reference([objets[i] for i in ordre], capacite)
+    bins = [[(ordre[k - 1] + 1, t) for k, t in bac] for bac in bins]
+    placements = [(ordre[k - 1] + 1, t, b) for k, t, b in placements]
+    return bins, placements
+
+@pytest.mark.parametrize("graine", range(20))
+@pytest.mark.parametrize("heuristique, reference", DECROISSANTS)
+def test_decroissant_egale_balayage(heuristique, reference, graine):
+    objets, capacite = _instance(graine)
+    assert heuristique(objets, capacite) == _decroissant(reference, objets, capacite)
+
+@pytest.mark.parametrize("graine", range(20))
+@pytest.mark.parametrize("heuristique, reference", DECROISSANTS)
+def test_decroissant_longues_series(heuristique, reference, graine):
+    # peu de tailles distinctes : les objets identiques sont rangés par séries
+    rng = random.Random(graine)
+    capacite = rng.choice([12, 20, 30])
+    objets = [rng.choice([2, 3, 4, 5, 6, 10]) for _ in range(rng.randint(1, 200))]
+    assert heuristique(objets, capacite) == _decroissant(reference, objets, capacite)
+
+@pytest.mark.parametrize("heuristique, reference", DECROISSANTS)
+def test_decroissant_accepte_un_generateur(heuristique, reference):
+    objets, capacite = _instance(3)
+    assert heuristique(iter(objets), capacite) == _decroissant(reference, objets, capacite)
+
+@pytest.mark.parametrize("heuristique, reference", DECROISSANTS)
+def test_decroissant_egalites_et_grands_objets(heuristique, reference):
+    # WFD : bacs à égalité d'espace libre (écart multiple de la taille)
+    for objets, capacite in [([6, 6, 2, 2, 2, 2, 2, 2], 10), ([4, 4, 4, 2, 2, 2, 2, 2, 2, 2], 8),
+                             ([12, 12, 3, 11, 3, 3], 10), ([5] * 7 + [1] * 9, 10)]:
+        assert heuristique(objets, capacite) == _decroissant(reference, objets, capacite)
+
+def _en_ligne(objets, capacite, k, policy):
+    """Bacs produits par online_fit et, pour chacun, le nombre d'objets lus au moment où il sort"""
+    lus = []
+    def flux():
+        for obj in objets:
+            lus.append(obj)
+            yield obj
+    return [(numero, contenu, len(lus)) for numero, contenu in un_d.online_fit(flux(), capacite, k, policy)]
+
+@pytest.mark.parametrize("graine", range(20))
+@pytest.mark.parametrize("policy", ["NKF", "HARMONIC"])
+@pytest.mark.parametrize("k", [1, 2, 4])
+def test_en_ligne_borne_sans_debordement(k, policy, graine):
+    objets, capacite = _instance(graine)
+    bacs = _en_ligne(objets, capacite, k, policy)
+    assert sorted(numero for numero, _, _ in bacs) == list(range(1, len(bacs) + 1))
+    assert sorted(obj for _, contenu, _ in bacs for obj in contenu) == list(enumerate(objets, 1))
+    assert all(sum(t for _, t in contenu) <= capacite for _, contenu, _ in bacs)
+    # après chaque objet lu, au plus k bacs sont ouverts : entamés et pas encore produits
+    for t in range(1, len(objets) + 1):
+        ouverts = sum(1 for _, contenu, sortie in bacs if contenu[0][0] <= t and sortie > t)
+        assert ouverts <= k
+
+def test_next_k_fit_extremes():
+    objets, capacite = _instance(4)
+    # k = 1 : Next Fit ; k assez grand : aucun bac fermé avant d'être plein, First Fit
+    next_fit = []
+    for i, obj in enumerate(objets, 1):
+        if not next_fit or sum(t for _, t in next_fit[-1]) + obj > capacite:
+            next_fit.append([])
+        next_fit[-1].append((i, obj))
+    for k, attendus in [(1, next_fit), (len(objets), first_fit_balayage(objets, capacite)[0])]:
+        bacs = sorted(un_d.online_fit(objets, capacite, k, "NKF"))
+        assert [contenu for _, contenu in bacs] == attendus
+
+def test_harmonic_classes_de_taille():
+    # classe j < k : j objets de taille dans ]C/(j+1), C/j] par bac
+    objets = [7, 6, 4, 3, 4, 5, 2, 1, 1, 3]
+    assert list(un_d.online_fit(objets, 12, 3, "HARMONIC")) == [
+        (1, [(1, 7)]),
+        (2, [(2, 6), (6, 5)]),
+        (3, [(3, 4), (4, 3), (5, 4)]),
+        (4, [(7, 2), (8, 1), (9, 1), (10, 3)]),
+    ]
@@ -0,0 +1,25 @@
+import importlib
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+batch = importlib.import_module("1D_batch")
+un_d = importlib.import_module("1D")
+
+HEURISTIQUES = {"FF": un_d.first_fit, "BF": un_d.best_fit, "WF": un_d.worst_fit}
+
+@pytest.mark.parametrize("methode", sorted(HEURISTIQUES))
+def test_batch_fit_egale_les_heuristiques(methode):
+    rng = random.Random(0)
+    # longueurs très différentes (dont des instances vides) et capacités variées
+    instances = [[rng.randint(1, 30) for _ in range(rng.choice([0, 1, 5, 40, 120]))] for _ in range(30)]
+    capacites = [rng.choice([10, 30, 50]) for _ in instances]
+    tailles, offsets = batch.to_ragged(instances)
+    affectations, offsets = batch.batch_fit(tailles, offsets, capacites, methode)
+
+    for k, (objets, capacite) in enumerate(zip(instances, capacites)):
+        _, placements = HEURISTIQUES[methode](objets, capacite)
+        assert affectations[offsets[k]:offsets[k + 1]].tolist() == [b for _, _, b in placements]
+    attendus = [len(HEURISTIQUES[methode](objets, c)[0]) for objets, c in zip(instances, capacites)]
+    assert batch.bins_per_instance(affectations, offsets).tolist() == attendus
@@ -0,0 +1,81 @@
+import importlib
+import random
+
+import pytest
+
+fb = importlib.import_module("1D_fb")
+
+# Instances où First Fit Decreasing n'est pas optimal : (objets, capacité, optimum)
+FFD_NON_OPTIMAL = [
+    ([2, 4, 3, 5, 2, 4], 10, 2),
+    ([6, 5, 2, 2, 3, 3, 3], 12, 2),
+    ([4, 6, 14, 24, 5, 24, 25, 3, 3, 11], 30, 4),
+    ([20, 12, 7, 12, 5, 13, 14, 5, 6, 17, 20, 11], 30, 5),
+    ([5, 9, 9, 9, 3, 8, 18, 9, 6, 19], 20, 5),
+    ([11, 6, 3, 6, 11, 2, 6, 4, 5, 4], 12, 5),
+]
+
+def _multiensemble(objets):
+    quantites = {}
+    for obj in objets:
+        quantites[obj] = quantites.get(obj, 0) + 1
+    tailles = sorted(quantites, reverse=True)
+    return tailles, [quantites[t] for t in tailles]
+
+def _valide(bacs, objets, capacite):
+    assert sorted(obj for bac in bacs for obj in bac) == sorted(objets)
+    assert all(sum(bac) <= capacite for bac in bacs)
+
+@pytest.mark.parametrize("objets, capacite, optimum", FFD_NON_OPTIMAL)
+def test_ffd_non_optimal(objets, capacite, optimum):
+    assert len(fb._first_fit_decreasing(sorted(objets, reverse=True), capacite)) > optimum
+
+@pytest.mark.parametrize("objets, capacite, optimum", FFD_NON_OPTIMAL)
+def test_dp_egale_recherche_exhaustive(objets, capacite, optimum):
+    nb, bacs = fb.bin_packing_dp(objets, capacite)
+    assert nb == fb.bin_packing_all_combinations(objets, capacite)[0] == optimum
+    _valide(bacs, objets, capacite)
+
+def test_borne_lp_ne_depasse_pas_l_optimum():
+    objets = [96, 25, 97, 100, 58, 67, 32, 26, 46, 60, 61, 24, 79, 69, 35, 81, 86, 21, 53, 29,
+              91, 31, 30, 63, 34, 86, 41, 73, 92]
+    tailles, comptes = _multiensemble(objets)
+    assert fb.borne_lp(tailles, comptes, 100) <= 18
+    assert fb.bin_packing_dp(objets, 100)[0] == 18
+
+def test_borne_lp_sans_convergence_reste_valide():
+    objets = list(range(100, 700, 3))
+    tailles, comptes = _multiensemble(objets)
+    nb_ffd = len(fb._first_fit_decreasing(sorted(objets, reverse=True), 1000))
+    borne = fb.borne_lp(tailles, comptes, 1000, max_iterations=20)
+    assert fb.borne_l2(tailles, 1000, comptes) <= borne <= nb_ffd
+
+def test_budget_renvoie_un_rangement_valide():
+    objets = [20 + (7 * i) % 31 for i in range(100)]
+    nb, bacs = fb.bin_packing_all_combinations(objets, 100, max_noeuds=50)
+    _valide(bacs, objets, 100)
+    assert nb == len(bacs) >= fb.borne_l2(objets, 100)
+
+def test_preuve_d_optimalite():
+    objets, capacite, optimum = FFD_NON_OPTIMAL[3]
+    assert fb.bin_packing_all_combinations(objets, capacite, preuve=True)[::2] == (optimum, True)
+    # budget épuisé avant la preuve : le résultat n'est plus garanti optimal
+    nb, bacs, optimal = fb.bin_packing_all_combinations(objets, capacite, max_noeuds=1, preuve=True)
+    _valide(bacs, objets, capacite)
+    assert nb > optimum and not optimal
+    # avec assez de budget, la preuve est faite
+    assert fb.bin_packing_all_combinations(objets, capacite, max_noeuds=10000, preuve=True)[::2] == (optimum, True)
+
+@pytest.mark.parametrize("objets, capacite, optimum", FFD_NON_OPTIMAL)
+def test_parallele_optimal(objets, capacite, optimum):
+    nb, bacs = fb.bin_packing_parallele(objets, capacite, processus=2)
+    assert nb == len(bacs) == optimum
+    _valide(bacs, objets, capacite)
+
+@pytest.mark.parametrize("graine", range(5))
+def test_parallele_egale_recherche_serie(graine):
+    rng = random.Random(graine)
+    objets = [rng.randint(10, 60) for _ in range(18)]
+    nb, bacs = fb.bin_packing_parallele(objets, 100, profondeur=rng.randint(1, 3), processus=2)
+    assert nb == fb.bin_packing_all_combinations(objets, 100)[0]
+    _valide(bacs, objets, 100)
@@ -0,0 +1,174 @@
+import importlib
+import random
+
+import pytest
+
+deux_d = importlib.import_module("2D")
+
+RECTANGLES = [(6, 9), (8, 9), (2, 8), (5, 8), (3, 5), (5, 5), (4, 3), (4, 3), (3, 1)]
+
+def _valide(placements, rectangles, W, H):
+    assert sorted(p["id"] for p in placements) == list(range(1, len(rectangles) + 1))
+    for p in placements:
+        (x, y), (w, h) = p["position"], p["dimension"]
+        assert (w, h) == rectangles[p["id"] - 1]
+        assert 0 <= x and x + w <= W and 0 <= y and y + h <= H
+    for a in placements:
+        for b in placements:
+            if a["id"] < b["id"]:
+                (ax, ay), (aw, ah) = a["position"], a["dimension"]
+                (bx, by), (bw, bh) = b["position"], b["dimension"]
+                assert ax + aw <= bx or bx + bw <= ax or ay + ah <= by or by + bh <= ay
+
+# Version d'origine, par balayage de toutes les étagères
+def FFDH_balayage(rectangles, W, H):
+    rectangles = sorted(rectangles, key=lambda r: r[1], reverse=True)
+    shelves = []
+    placements = []
+    for i, (w, h) in enumerate(rectangles):
+        for shelf in shelves:
+            if h <= shelf[1] and shelf[2] + w <= W:
+                placements.append({"id": i + 1, "position": (shelf[2], shelf[0]), "dimension": (w, h)})
+                shelf[2] += w
+                break
+        else:
+            current_y = sum(s[1] for s in shelves)
+            if current_y + h > H:
+                continue
+            shelves.append([current_y, h, w])
+            placements.append({"id": i + 1, "position": (0, current_y), "dimension": (w, h)})
+    return placements
+
+def BFDH_balayage(rectangles, W, H):
+    rectangles = sorted(rectangles, key=lambda r: r[1], reverse=True)
+    shelves = []
+    placements = []
+    for i, (w, h) in enumerate(rectangles):
+        best_shelf = None
+        min_space_left = float("inf")
+        for shelf in shelves:
+            space_left = W - shelf[2]
+            if h <= shelf[1] and w <= space_left and space_left < min_space_left:
+                best_shelf = shelf
+                min_space_left = space_left
+        if best_shelf:
+            placements.append({"id": i + 1, "position": (best_shelf[2], best_shelf[0]), "dimension": (w, h)})
+            best_shelf[2] += w
+        else:
+            current_y = sum(s[1] for s in shelves)
+            if current_y + h > H:
+                continue
+            shelves.append([current_y, h, w])
+            placements.append({"id": i + 1, "position": (0, current_y), "dimension": (w, h)})
+    return placements
+
+def FFDH_multi_balayage(rectangles, W, H):
+    # première étagère assez large, plaque par plaque, sinon première plaque assez haute
+    ordre = sorted(range(len(rectangles)), key=lambda i: rectangles[i][1], reverse=True)
+    plaques = []
+    placements = []
+    for i in ordre:
+        w, h = rectangles[i]
+        if w > W or h > H:
+            continue
+        for p, shelves in enumerate(plaques):
+            shelf = next((s for s in shelves if W - s[2] >= w), None)
+            if shelf is not None:
+                x, y = shelf[2], shelf[0]
+                shelf[2] += w
+                break
+        else:
+            for p, shelves in enumerate(plaques):
+                if H - sum(s[1] for s in shelves) >= h:
+                    break
+            else:
+                p = len(plaques)
+                plaques.append([])
+            x, y = 0, sum(s[1] for s in plaques[p])
+            plaques[p].append([y, h, w])
+        placements.append({"id": i + 1, "bac": p + 1, "position": (x, y), "dimension": (w, h)})
+    return placements
+
+def _rectangles(graine):
+    rng = random.Random(graine)
+    W = rng.choice([10, 20, 100])
+    rectangles = [(rng.randint(1, W), rng.randint(1, W)) for _ in range(rng.randint(0, 300))]
+    return rectangles, W, rng.choice([W, 5 * W, 10 ** 6])
+
+def _hauteur(placements):
+    return max(p["position"][1] + p["dimension"][1] for p in placements)
+
+def test_budget_epuise_renvoie_au_moins_ffdh():
+    ffdh = deux_d.FFDH(RECTANGLES, 10, 40)
+    assert len(ffdh) == len(RECTANGLES)
+    for budget in ({"max_noeuds": 1}, {"timeout": 0}):
+        placements = deux_d.brute_force_packing_2d(RECTANGLES, 10, 40, **budget)
+        _valide(placements, RECTANGLES, 10, 40)
+        assert _hauteur(placements) <= _hauteur(ffdh)
+
+def test_sans_budget_none_seulement_si_impossible():
+    exact = deux_d.brute_force_packing_2d(RECTANGLES, 10, 30)
+    _valide(exact, RECTANGLES, 10, 30)
+    assert len(deux_d.FFDH(RECTANGLES, 10, 30)) < len(RECTANGLES)  # FFDH ne tient pas
+    assert deux_d.brute_force_packing_2d(RECTANGLES, 10, 20) is None
+
+def _sans_chevauchement(placements, rectangles, W, H):
+    ids = [p["id"] for p in placements]
+    assert len(set(ids)) == len(ids)
+    for p in placements:
+        (x, y), (w, h) = p["position"], p["dimension"]
+        assert (w, h) == rectangles[p["id"] - 1]
+        assert 0 <= x and x + w <= W and 0 <= y and y + h <= H
+    # balayage par x : seuls les rectangles qui se recouvrent en x sont comparés
+    tries = sorted(placements, key=lambda p: p["position"][0])
+    for k, a in enumerate(tries):
+        (ax, ay), (aw, ah) = a["position"], a["dimension"]
+        for b in tries[k + 1:]:
+            (bx, by), (_, bh) = b["position"], b["dimension"]
+            if bx >= ax + aw:
+                break
+            assert ay + ah <= by or by + bh <= ay
+
+def test_skyline_et_maxrects_valides():
+    rng = random.Random(0)
+    for W, H in [(20, 60), (100, 10 ** 6)]:
+        rectangles = [(rng.randint(1, W // 2), rng.randint(1, W // 2)) for _ in range(400)]
+        moteurs = [deux_d.Skyline] + [
+            lambda r, W, H, heuristique=heuristique: deux_d.MaxRects(r, W, H, heuristique)
+            for heuristique in ("BSSF", "BAF", "BL")]
+        for moteur in moteurs:
+            placements = moteur(rectangles, W, H)
+            _sans_chevauchement(placements, rectangles, W, H)
+            if H > 1000:
+                assert len(placements) == len(rectangles)
+
+@pytest.mark.parametrize("graine", range(20))
+def test_ffdh_egale_balayage(graine):
+    rectangles, W, H = _rectangles(graine)
+    assert deux_d.FFDH(rectangles, W, H) == FFDH_balayage(rectangles, W, H)
+
+@pytest.mark.parametrize("graine", range(20))
+def test_bfdh_egale_balayage(graine):
+    rectangles, W, H = _rectangles(graine)
+    assert deux_d.BFDH(rectangles, W, H) == BFDH_balayage(rectangles, W, H)
+
+def test_etageres_rectangle_trop_large():
+    rectangles = [(4, 5), (12, 4), (6, 3), (3, 3), (7, 2), (1, 1)]
+    assert deux_d.FFDH(rectangles, 10, 20) == FFDH_balayage(rectangles, 10, 20)
+    assert deux_d.BFDH(rectangles, 10, 20) == BFDH_balayage(rectangles, 10, 20)
+
+@pytest.mark.parametrize("graine", range(20))
+def test_ffdh_multi_egale_balayage(graine):
+    rectangles, W, H = _rectangles(graine)
+    placements = deux_d.FFDH_multi(rectangles, W, H)
+    assert placements == FFDH_multi_balayage(rectangles, W, H)
+    for p in set(p["bac"] for p in placements):
+        _sans_chevauchement([q for q in placements if q["bac"] == p], rectangles, W, H)
+
+@pytest.mark.parametrize("graine", range(10))
+def test_ffdh_multi_sur_une_plaque_egale_ffdh(graine):
+    rectangles, W, _ = _rectangles(graine)
+    ordre = sorted(range(len(rectangles)), key=lambda i: rectangles[i][1], reverse=True)
+    # FFDH numérote les rectangles dans l'ordre trié, FFDH_multi dans l'ordre d'origine
+    attendu = [dict(p, id=ordre[p["id"] - 1] + 1, bac=1) for p in deux_d.FFDH(rectangles, W, 10 ** 9)]
+    assert deux_d.FFDH_multi(rectangles, W, 10 ** 9) == attendu
@@ -0,0 +1,128 @@
+import importlib
+import itertools
+import math
+import random
+
+import pytest
+
+bf = importlib.import_module("2DPackingBruteForce")
+
+def placer_balayage(shapes, perm, rot_combo, W, H):
+    """Pose d'origine : toutes les positions entières, y puis x, testées
+    contre toutes les formes déjà posées"""
+    placements = []
+    for idx, (shape_idx, rotation) in enumerate(zip(perm, rot_combo)):
+        shape = dict(shapes[shape_idx], id=idx + 1, rotation=rotation)
+        w, h = bf._dimensions(shape, rotation)
+        if w > W or h > H:
+            return None
+        shape["width"], shape["height"] = w, h
+        for y, x in itertools.product(range(H - int(h) + 1), range(W - int(w) + 1)):
+            shape["position"] = (x, y)
+            if not any(bf.shapes_overlap(shape, p) for p in placements):
+                placements.append(dict(shape))
+                break
+        else:
+            return None
+    return placements, max((p["position"][1] + p["height"] for p in placements), default=0)
+
+def brute_force_balayage(shapes, W, H):
+    """Meilleure hauteur de la recherche d'origine (toutes permutations et rotations)"""
+    meilleure = None
+    for perm in itertools.permutations(range(len(shapes))):
+        rotations = [[0] if shapes[i]["type"] == "cercle" else [0, math.pi/2, math.pi, 3*math.pi/2]
+                     for i in perm]
+        for rot_combo in itertools.product(*rotations):
+            resultat = placer_balayage(shapes, perm, rot_combo, W, H)
+            if resultat is not None and (meilleure is None or resultat[1] < meilleure):
+                meilleure = resultat[1]
+    return meilleure
+
+def _hauteur(placements):
+    return max(p["position"][1] + p["height"] for p in placements)
+
+def _formes(rng, n, W):
+    formes = []
+    for _ in range(n):
+        type_forme = rng.choice(["rectangle", "triangle", "cercle"])
+        if type_forme == "cercle":
+            formes.append({"type": "cercle", "dimension": (rng.randint(1, W // 2 + 1),)})
+        else:
+            formes.append({"type": type_forme, "dimension": (rng.randint(1, W // 2), rng.randint(1, W // 2))})
+    return formes
+
+@pytest.mark.parametrize("graine", range(30))
+def test_pose_egale_balayage(graine):
+    rng = random.Random(graine)
+    W, H = rng.randint(4, 9), 12
+    formes = _formes(rng, rng.randint(1, 6), W)
+    perm = rng.sample(range(len(formes)), len(formes))
+    rot_combo = [rng.choice(bf.orientations(formes[i])) for i in perm]
+    attendu = placer_balayage(formes, perm, rot_combo, W, H)
+    obtenu = bf.placer_sequence(formes, perm, rot_combo, W, H)
+    if attendu is None:
+        assert obtenu is None
+    else:
+        assert [p["position"] for p in obtenu[0]] == [p["position"] for p in attendu[0]]
+        assert obtenu[1] == attendu[1]
+
+def test_rectangles_dans_le_carre_d_un_cercle():
+    # les petits rectangles se logent dans les coins du carré du cercle
+    formes = [{"type": "cercle", "dimension": (7,)}] + [{"type": "rectangle", "dimension": (1, 1)}] * 4
+    assert _hauteur(bf.brute_force_packing(formes, 7, 10)) == 7
+
+def test_rectangle_a_cote_de_deux_cercles():
+    formes = [{"type": "cercle", "dimension": (4,)}] * 2 + [{"type": "rectangle", "dimension": (1, 1)}]
+    assert _hauteur(bf.brute_force_packing(formes, 7, 10)) == 7
+
+@pytest.mark.parametrize("graine", range(8))
+def test_meme_hauteur_que_la_recherche_d_origine(graine):
+    rng = random.Random(100 + graine)
+    W = rng.randint(5, 8)
+    formes = _formes(rng, 3, W)
+    attendu = brute_force_balayage(formes, W, 14)
+    placements = bf.brute_force_packing(formes, W, 14)
+    assert (_hauteur(placements) if placements else None) == attendu
+
+@pytest.mark.parametrize("graine", range(4))
+@pytest.mark.parametrize("profondeur", [1, 2])
+def test_parallele_egale_recherche_serie(profondeur, graine):
+    rng = random.Random(200 + graine)
+    W = rng.randint(5, 8)
+    formes = _formes(rng, 4, W)
+    serie = bf.brute_force_packing(formes, W, 16, timeout=60)
+    parallele = bf.brute_force_packing_parallele(formes, W, 16, timeout=60, profondeur=profondeur,
+                                                 processus=2)
+    # à hauteur égale, la solution gardée est celle de la recherche séquentielle
+    assert parallele == serie
+    if serie:
+        assert _hauteur(serie) == brute_force_balayage(formes, W, 16)
+
+def _anytime(recherche, formes, W, H, **options):
+    hauteurs = []
+    placements = recherche(formes, W, H, timeout=60, anytime=True,
+                           amelioration=lambda hauteur, _: hauteurs.append(hauteur), **options)
+    return placements, hauteurs
+
+@pytest.mark.parametrize("graine", range(12))
+def test_anytime_ameliorations_decroissantes(graine):
+    rng = random.Random(300 + graine)
+    W = rng.randint(5, 8)
+    formes = _formes(rng, 4, W)
+    optimum = _hauteur(bf.brute_force_packing(formes, W, 16, timeout=60))
+    depart = bf.depart_heuristique(formes, W, 16)
+    for recherche, options in [(bf.brute_force_packing, {}),
+                               (bf.brute_force_packing_parallele, {"processus": 2})]:
+        placements, hauteurs = _anytime(recherche, formes, W, 16, **options)
+        assert all(a > b for a, b in zip(hauteurs, hauteurs[1:]))
+        assert hauteurs[-1] == _hauteur(placements) == optimum
+        if depart:
+            assert hauteurs[0] == depart[0]
+
+def test_anytime_ameliore_le_depart():
+    rng = random.Random(305)
+    W = rng.randint(5, 8)
+    formes = _formes(rng, 4, W)
+    assert bf.depart_heuristique(formes, W, 16)[0] == 7
+    assert _anytime(bf.brute_force_packing, formes, W, 16)[1] == [7, 6]
+    assert _anytime(bf.brute_force_packing_parallele, formes, W, 16, processus=2)[1] == [7, 6]
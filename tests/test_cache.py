@@ -0,0 +1,49 @@
+import importlib
+import random
+
+from cache import Cache
+
+un_d = importlib.import_module("1D")
+fb = importlib.import_module("1D_fb")
+deux_d = importlib.import_module("2D")
+
+def test_succes_egaux_aux_appels_directs(tmp_path):
+    rng = random.Random(0)
+    objets = [rng.randint(1, 10) for _ in range(40)]
+    melanges = rng.sample(objets, len(objets))
+    rectangles = [(rng.randint(1, 5), rng.randint(1, 5)) for _ in range(20)]
+    cache = Cache(dossier=tmp_path)
+
+    appels = [
+        (("1D", "first_fit", objets, 10), un_d.first_fit(objets, 10)),
+        (("1D", "first_fit_decreasing", objets, 10), un_d.first_fit_decreasing(objets, 10)),
+        # solveur invariant : même clé pour un autre ordre, ids rendus à l'appelant
+        (("1D", "first_fit_decreasing", melanges, 10), un_d.first_fit_decreasing(melanges, 10)),
+        (("1D_fb", "bin_packing_dp", melanges, 10), fb.bin_packing_dp(melanges, 10)),
+        (("2D", "FFDH", rectangles, 10, 40), deux_d.FFDH(rectangles, 10, 40)),
+    ]
+    for arguments, direct in appels:
+        assert cache.resoudre(*arguments) == direct
+    assert cache.succes == 1  # le second appel à first_fit_decreasing
+    for arguments, direct in appels:
+        assert cache.resoudre(*arguments) == direct
+    assert cache.succes == 1 + len(appels)
+
+    # nouveau cache sur le même dossier : tout est relu depuis le disque
+    disque = Cache(dossier=tmp_path)
+    for arguments, direct in appels:
+        assert disque.resoudre(*arguments) == direct
+    assert disque.echecs == 0
+
+def test_resultat_none_mis_en_cache():
+    cache = Cache()
+    # rectangle plus haut que le conteneur : aucun placement possible
+    assert cache.resoudre("2D", "brute_force_packing_2d", [(2, 9)], 10, 5) is None
+    assert cache.resoudre("2D", "brute_force_packing_2d", [(2, 9)], 10, 5) is None
+    assert (cache.succes, cache.echecs) == (1, 1)
+
+def test_copie_independante():
+    cache = Cache()
+    bins, _ = cache.resoudre("1D", "best_fit", [4, 6, 3], 10)
+    bins.append("modifié")
+    assert cache.resoudre("1D", "best_fit", [4, 6, 3], 10) == un_d.best_fit([4, 6, 3], 10)
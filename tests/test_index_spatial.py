@@ -0,0 +1,25 @@
+from index_spatial import IndexSpatial
+
+def test_inserer_candidats_retirer():
+    index = IndexSpatial(taille_case=2)
+    a, b, c = {"nom": "a"}, {"nom": "b"}, {"nom": "c"}
+    index.inserer(a, (0, 0, 3, 3))      # cases (0..1, 0..1)
+    index.inserer(b, (10, 10, 11, 11))  # case (5, 5)
+    index.inserer(c, (2, 2, 7, 3))      # s'étend sur plusieurs cases
+    assert len(index) == 3
+
+    # chaque objet n'est renvoyé qu'une fois, même s'il occupe plusieurs cases
+    proches = list(index.candidats((1, 1, 5, 2)))
+    assert sorted(o["nom"] for o in proches) == ["a", "c"]
+    assert [o["nom"] for o in index.candidats((10, 10, 10.5, 10.5))] == ["b"]
+
+    index.retirer(c)
+    assert len(index) == 2
+    assert [o["nom"] for o in index.candidats((1, 1, 5, 2))] == ["a"]
+    assert list(index.candidats((6, 2, 7, 3))) == []
+    assert (3, 1) not in index.cases  # les cases vidées sont supprimées
+    assert sorted(o["nom"] for o in index) == ["a", "b"]
+
+    index.retirer(a)
+    index.retirer(b)
+    assert len(index) == 0 and index.cases == {}
@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+import instances
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _listes(lues):
+    return [(d, list(v) if d == 1 else [list(c) for c in v]) for d, v in lues]
+
+def test_exp1d():
+    # les blocs de résultats ("ff", "bac 1 : ...") sont ignorés
+    attendu = [(1, [5, 2, 6, 2, 5]), (1, [6, 5, 5, 2, 2]), (1, [5, 5, 6, 2, 2])]
+    assert _listes(instances.lire(os.path.join(RACINE, "exp1D.txt"))) == attendu
+
+def test_exp2d():
+    attendu = [(2, [[9, 8, 7, 1, 1, 2, 8, 2, 2], [9, 8, 7, 6, 5, 4, 3, 2, 1]])]
+    assert _listes(instances.lire(os.path.join(RACINE, "exp2D.txt"))) == attendu
+    with pytest.raises(ValueError):
+        list(instances.lire(os.path.join(RACINE, "exp2D.txt"), dimension=1))
+
+def test_bloc_ambigu(tmp_path):
+    chemin = tmp_path / "ambigu.txt"
+    chemin.write_text("4 6\n3 2\n\n7\n1.5\n")
+    assert _listes(instances.lire(chemin)) == [(2, [[4, 3], [6, 2]]), (1, [7, 1.5])]
+    assert _listes(instances.lire(chemin, dimension=1)) == [(1, [4, 6, 3, 2]), (1, [7, 1.5])]
+
+def test_aller_retour_binaire(tmp_path):
+    donnees = [[5, 2, 6], [(9, 9), (1, 6)], [0.5, 2.25], [], [(1.5, 2), (3, 4)]]
+    chemin = tmp_path / "instances.bin"
+    assert instances.ecrire_binaire(chemin, donnees) == len(donnees)
+    assert instances.est_binaire(chemin)
+    relues = [list(v) if d == 1 else list(zip(*v)) for d, v in instances.lire(chemin)]
+    assert relues == [[5, 2, 6], [(9, 9), (1, 6)], [0.5, 2.25], [], [(1.5, 2.0), (3.0, 4.0)]]
+
+def test_conversion_texte_binaire(tmp_path):
+    for nom in ("exp1D.txt", "exp2D.txt"):
+        source = os.path.join(RACINE, nom)
+        destination = tmp_path / (nom + ".bin")
+        instances.convertir(source, destination)
+        assert _listes(instances.lire(destination)) == _listes(instances.lire(source))
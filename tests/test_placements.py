@@ -0,0 +1,100 @@
+import importlib
+import math
+import random
+
+import numpy as np
+import pytest
+
+from placements import PlacementArray
+
+deux_d = importlib.import_module("2D")
+multi = importlib.import_module("2DPackingMultiForm")
+
+def _rectangles(graine):
+    rng = random.Random(graine)
+    return [(rng.randint(1, 10), rng.randint(1, 10)) for _ in range(60)]
+
+def _formes(graine):
+    rng = random.Random(graine)
+    formes = []
+    for _ in range(30):
+        type_forme = rng.choice(["rectangle", "triangle", "cercle"])
+        if type_forme == "cercle":
+            formes.append({"type": "cercle", "dimension": (rng.randint(1, 5),)})
+        else:
+            formes.append({"type": type_forme, "dimension": (rng.randint(1, 12), rng.randint(1, 4))})
+    return formes
+
+SOLVEURS = [
+    (deux_d.NFDH, _rectangles), (deux_d.FFDH, _rectangles), (deux_d.FFDH_multi, _rectangles),
+    (deux_d.BFDH, _rectangles), (deux_d.Skyline, _rectangles), (deux_d.MaxRects, _rectangles),
+    (multi.NFDH, _formes), (multi.FFDH, _formes), (multi.BestFit, _formes),
+]
+
+@pytest.mark.parametrize("graine", range(3))
+@pytest.mark.parametrize("solveur, generateur", SOLVEURS)
+def test_colonnes_relues_comme_la_liste(solveur, generateur, graine):
+    donnees = generateur(graine)
+    attendus = solveur(donnees, 20, 30)
+    placements = solveur(donnees, 20, 30, columnar=True)
+    assert len(placements) == len(attendus)
+    assert list(placements) == attendus
+    assert [placements[i] for i in range(len(attendus))] == attendus
+    if attendus:
+        assert placements[-1] == attendus[-1]
+        assert placements[1:4] == attendus[1:4]
+
+def test_cles_propres_a_chaque_placement():
+    dicts = [
+        {"id": 1, "position": (0, 0), "dimension": (2, 3)},
+        {"id": 2, "bac": 2, "position": (0, 0), "dimension": (4, 1)},
+        {"id": 3, "type": "triangle", "position": (1, 2), "dimension": (3, 5), "rotation": math.pi / 2,
+         "width": 5, "height": 3},
+        {"id": 4, "type": "cercle", "position": (5, 5), "dimension": (2,), "rotation": 0},
+    ]
+    placements = PlacementArray(dicts)
+    assert list(placements) == dicts
+    for attendu, relu in zip(dicts, placements):
+        assert relu.keys() == attendu.keys()
+
+def test_entiers_relus_en_entiers_apres_passage_en_flottants():
+    dicts = [
+        {"id": 1, "position": (3, 0), "dimension": (2, 3)},
+        {"id": 2, "position": (2.5, 1), "dimension": (2, 3.25)},
+        {"id": 3, "position": (4, 2**40), "dimension": (1, 1), "rotation": 0.3},
+        {"id": 4, "position": (6, 0), "dimension": (1, 1), "rotation": 0},
+    ]
+    placements = PlacementArray(dicts)
+    assert placements.colonnes["x"].typecode == "d"
+    assert placements.colonnes["y"].typecode == "q"
+    assert list(placements) == dicts
+    assert [type(p["position"][0]) for p in placements] == [int, float, int, int]
+    assert [type(p["dimension"][1]) for p in placements] == [int, float, int, int]
+
+def _exemple():
+    return PlacementArray([
+        {"id": 1, "position": (0, 0), "dimension": (2, 3), "bac": 1},
+        {"id": 2, "position": (2.5, 2**40), "dimension": (2, 3), "bac": 2, "rotation": math.pi / 2},
+        {"id": 3, "type": "cercle", "position": (1, 1), "dimension": (4,), "rotation": 0.3},
+    ])
+
+def test_to_numpy():
+    placements = _exemple()
+    tableaux = placements.to_numpy()
+    assert set(tableaux) == set(placements.colonnes)
+    for nom, tableau in tableaux.items():
+        assert tableau.tolist() == placements.colonnes[nom].tolist()
+        assert tableau.itemsize == placements.colonnes[nom].itemsize
+    assert tableaux["x"].tolist() == [0.0, 2.5, 1.0]
+    assert tableaux["y"].dtype == np.int64 and tableaux["y"][1] == 2**40
+    # pas de copie : la mémoire est celle de la colonne
+    placements.colonnes["id"][0] = 7
+    assert tableaux["id"][0] == 7
+
+def test_sauver_npy(tmp_path):
+    placements = _exemple()
+    placements.sauver_npy(tmp_path / "essai")
+    for nom, tableau in placements.to_numpy().items():
+        relu = np.load(tmp_path / f"essai_{nom}.npy")
+        assert relu.dtype == tableau.dtype
+        assert relu.tolist() == tableau.tolist()
@@ -0,0 +1,32 @@
+import importlib
+import re
+import struct
+
+import rendu
+
+deux_d = importlib.import_module("2D")
+
+def _cadres_svg(svg):
+    return re.findall(r'<rect x="([\d.]+)" y="[\d.]+" width="[\d.]+" height="[\d.]+" '
+                      r'fill="none" stroke="black" stroke-width="3"/>', svg)
+
+def test_une_plaque_sans_bac():
+    placements = deux_d.FFDH([(2, 3), (4, 1)], 8, 8)
+    svg = rendu.vers_svg(8, 8, placements, scale=10, padding=5)
+    assert _cadres_svg(svg) == ["5"]
+    assert 'width="90"' in svg
+
+def test_plusieurs_plaques_cote_a_cote():
+    # trois carrés de 8 x 8 : un par plaque
+    placements = deux_d.FFDH_multi([(8, 8)] * 3, 8, 8)
+    assert sorted(p["bac"] for p in placements) == [1, 2, 3]
+    assert [tuple(p["position"]) for p in placements] == [(0, 0)] * 3
+
+    svg = rendu.vers_svg(8, 8, placements, scale=10, padding=5)
+    assert _cadres_svg(svg) == ["5", "90", "175"]
+    formes = re.findall(r'<rect x="([\d.]+)" y="([\d.]+)" width="80" height="80" fill="skyblue"', svg)
+    assert sorted(formes) == [("175", "5"), ("5", "5"), ("90", "5")]
+
+    png = rendu.vers_png(8, 8, placements, scale=10, padding=5)
+    largeur, hauteur = struct.unpack(">II", png[16:24])
+    assert (largeur, hauteur) == (3 * 85 + 5, 90)